@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""Config caching helpers: on-disk validated-config cache and per-cfg memos."""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+CACHE_ENV_DISABLE = "AGENT_CLI_CONFIG_CACHE"
+CACHE_ENV_DIR = "AGENT_CLI_CACHE_DIR"
+
+FileStat = Tuple[str, int, int]
+
+# Per-file namespaces get one cache entry per source (e.g. per task manifest);
+# beyond this many, the least recently written entries are removed.
+MAX_ENTRIES_PER_NAMESPACE = 64
+T = TypeVar("T")
+
+# id(cfg) -> (cfg, {helper: result}). Holding cfg keeps its id from being reused,
+# so only the most recently memoized _MAX_CFG_MEMOS cfgs are kept: a long-lived
+# caller reloading edited config would otherwise pin every cfg it ever saw.
+_MAX_CFG_MEMOS = 4
+_CFG_MEMO: Dict[int, Tuple[Dict[str, Any], Dict[Callable[..., Any], Any]]] = {}
+
+# namespace -> {abs path: (fingerprint, data)} for sources loaded in this
+# process, least recently used first and at most MAX_ENTRIES_PER_NAMESPACE each.
+_FILE_MEMO: Dict[str, Dict[str, Tuple[str, Any]]] = {}
+
+
+def _memo_get(
+    namespace: str, source: str, fingerprint: str
+) -> Optional[Tuple[str, Any]]:
+    """The (fingerprint, data) memo entry for source if still current."""
+    memo = _FILE_MEMO.get(namespace)
+    if memo is None:
+        return None
+    hit = memo.pop(source, None)
+    if hit is None or hit[0] != fingerprint:
+        return None
+    memo[source] = hit  # re-inserted last: most recently used
+    return hit
+
+
+def _memo_put(namespace: str, source: str, fingerprint: str, data: Any) -> None:
+    memo = _FILE_MEMO.setdefault(namespace, {})
+    memo.pop(source, None)
+    while len(memo) >= MAX_ENTRIES_PER_NAMESPACE:
+        del memo[next(iter(memo))]
+    memo[source] = (fingerprint, data)
+
+
+def cache_dir() -> str:
+    override = os.environ.get(CACHE_ENV_DIR)
+    if override:
+        return override
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "agent-cli")
+
+
+def cache_enabled() -> bool:
+    return os.environ.get(CACHE_ENV_DISABLE, "1") not in ("0", "false", "off")
+
+
+def _scan_yaml_stats(root: str, rel: str, out: List[FileStat]) -> None:
+    with os.scandir(os.path.join(root, rel) if rel else root) as it:
+        for entry in it:
+            entry_rel = f"{rel}/{entry.name}" if rel else entry.name
+            if entry.is_dir():
+                # Directory names are part of the key even when empty: loaders
+                # pick between alternative layouts (servants/ vs servant/).
+                out.append((f"{entry_rel}/", 0, 0))
+                _scan_yaml_stats(root, entry_rel, out)
+            elif rel and entry.name.endswith(".yaml"):
+                # Top-level files (config-state.*) are generated snapshots that
+                # are rewritten on every sync; they never feed the loaders.
+                st = entry.stat()
+                out.append((entry_rel, st.st_mtime_ns, st.st_size))
+
+
+def _loader_source_stats(loader: Callable[[str], Any], out: List[FileStat]) -> None:
+    # The validator source is part of the key so that rule changes invalidate
+    # previously cached results.
+    module_file = getattr(sys.modules.get(loader.__module__), "__file__", None)
+    if module_file:
+        st = os.stat(module_file)
+        out.append((os.path.abspath(module_file), st.st_mtime_ns, st.st_size))
+
+
+def _digest(key: Any) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr(key).encode("utf-8"))
+    return h.hexdigest()
+
+
+def config_fingerprint(root: str, loader: Callable[[str], Any]) -> str:
+    stats: List[FileStat] = []
+    _scan_yaml_stats(root, "", stats)
+    stats.sort()
+    _loader_source_stats(loader, stats)
+    return _digest((root, loader.__qualname__, stats))
+
+
+def file_fingerprint(path: str, loader: Callable[[str], Any]) -> str:
+    st = os.stat(path)
+    stats: List[FileStat] = [(path, st.st_mtime_ns, st.st_size)]
+    _loader_source_stats(loader, stats)
+    return _digest((loader.__qualname__, stats))
+
+
+def _cache_path(namespace: str, source: str) -> str:
+    source_key = hashlib.blake2b(source.encode("utf-8"), digest_size=8).hexdigest()
+    return os.path.join(cache_dir(), f"{namespace}-{source_key}.pkl")
+
+
+def _prune_namespace(namespace: str, keep: int = MAX_ENTRIES_PER_NAMESPACE) -> None:
+    prefix = f"{namespace}-"
+    # <prefix><16 hex digits>.pkl exactly, so "manifest" never matches the
+    # entries of a "manifest-routing" namespace.
+    name_len = len(prefix) + 20
+    entries: List[Tuple[int, str]] = []
+    try:
+        with os.scandir(cache_dir()) as it:
+            for entry in it:
+                name = entry.name
+                if (
+                    len(name) == name_len
+                    and name.startswith(prefix)
+                    and name.endswith(".pkl")
+                ):
+                    try:
+                        entries.append((entry.stat().st_mtime_ns, entry.path))
+                    except OSError:
+                        pass
+    except OSError:
+        return
+    if len(entries) <= keep:
+        return
+    entries.sort()
+    for _, path in entries[:-keep]:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def _read_cache(path: str, fingerprint: str) -> Optional[Any]:
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    except OSError:
+        return None
+    with os.fdopen(fd, "rb") as f:
+        # Entries are unpickled, so only trust files this user wrote and that
+        # nobody else can modify (AGENT_CLI_CACHE_DIR may be a shared dir).
+        st = os.fstat(fd)
+        if st.st_uid != os.getuid() or st.st_mode & 0o022:
+            return None
+        try:
+            stored_fingerprint, cfg = pickle.load(f)
+        except Exception:
+            return None
+    if stored_fingerprint != fingerprint:
+        return None
+    return cfg
+
+
+def _write_cache(path: str, fingerprint: str, cfg: Any) -> None:
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        # Private (0600) temp file with a random name, created with O_EXCL.
+        fd, tmp = tempfile.mkstemp(
+            prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory
+        )
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((fingerprint, cfg), f, protocol=5)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+def cached_load(
+    namespace: str, config_root: str, loader: Callable[[str], Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Return loader(config_root), reusing the last validated result when the
+    config files and validator source are unchanged.
+
+    Cache problems (unreadable/corrupt entries, unwritable directory) never
+    fail the caller; they fall back to a full load.
+    """
+    if not cache_enabled():
+        return loader(config_root)
+
+    root = os.path.abspath(config_root)
+    try:
+        fingerprint = config_fingerprint(root, loader)
+    except OSError:
+        # Let the loader report missing directories/files in its own terms.
+        return loader(config_root)
+
+    # Long-lived callers get the same cfg object back while nothing changed,
+    # which keeps per_cfg memos warm.
+    hit = _memo_get(namespace, root, fingerprint)
+    if hit is not None:
+        return hit[1]
+
+    path = _cache_path(namespace, root)
+    cfg = _read_cache(path, fingerprint)
+    if cfg is None:
+        cfg = loader(config_root)
+        _write_cache(path, fingerprint, cfg)
+    _memo_put(namespace, root, fingerprint, cfg)
+    return cfg
+
+
+def cached_file_load(namespace: str, path: str, loader: Callable[[str], Any]) -> Any:
+    """Return loader(path), reusing an earlier parse while the file is unchanged.
+
+    Parses are kept in process and, unless disabled, on disk keyed by
+    (path, mtime_ns, size), at most MAX_ENTRIES_PER_NAMESPACE sources per
+    namespace in each. The result is shared; do not mutate it.
+    """
+    abs_path = os.path.abspath(path)
+    try:
+        fingerprint = file_fingerprint(abs_path, loader)
+    except OSError:
+        return loader(path)
+
+    hit = _memo_get(namespace, abs_path, fingerprint)
+    if hit is not None:
+        return hit[1]
+
+    data = None
+    use_disk = cache_enabled()
+    if use_disk:
+        cache_path = _cache_path(namespace, abs_path)
+        data = _read_cache(cache_path, fingerprint)
+    if data is None:
+        data = loader(path)
+        if use_disk:
+            _write_cache(cache_path, fingerprint, data)
+            _prune_namespace(namespace)
+    _memo_put(namespace, abs_path, fingerprint, data)
+    return data
+
+
+def source_fingerprint(fn: Callable[..., Any]) -> str:
+    """Fingerprint of fn's defining source file, for caches keyed by other means."""
+    stats: List[FileStat] = []
+    _loader_source_stats(fn, stats)
+    return _digest((fn.__qualname__, stats))
+
+
+def read_entry(namespace: str, source: str, fingerprint: str) -> Optional[Any]:
+    """The data last stored by write_entry() for (namespace, source), if its
+    fingerprint matches; None otherwise."""
+    return _read_cache(_cache_path(namespace, source), fingerprint)
+
+
+def write_entry(namespace: str, source: str, fingerprint: str, data: Any) -> None:
+    _write_cache(_cache_path(namespace, source), fingerprint, data)
+
+
+def stamp_matches(namespace: str, source: str, fingerprint: str) -> bool:
+    """True when the last write_stamp() for (namespace, source) used fingerprint."""
+    return _read_cache(_cache_path(namespace, source), fingerprint) is not None
+
+
+def write_stamp(namespace: str, source: str, fingerprint: str) -> None:
+    _write_cache(_cache_path(namespace, source), fingerprint, True)
+    _prune_namespace(namespace)
+
+
+def per_cfg(fn: Callable[[Dict[str, Any]], T]) -> Callable[[Dict[str, Any]], T]:
+    """Memoize a helper derived only from cfg, per cfg object.
+
+    Memos are kept for the last few distinct cfgs seen; older ones are dropped
+    (and recomputed if that cfg is used again). Results are shared between
+    callers and must be treated as read-only.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(cfg: Dict[str, Any]) -> T:
+        entry = _CFG_MEMO.get(id(cfg))
+        if entry is None or entry[0] is not cfg:
+            entry = (cfg, {})
+            _CFG_MEMO.pop(id(cfg), None)
+            while len(_CFG_MEMO) >= _MAX_CFG_MEMOS:
+                del _CFG_MEMO[next(iter(_CFG_MEMO))]
+            _CFG_MEMO[id(cfg)] = entry
+        memo = entry[1]
+        if fn not in memo:
+            memo[fn] = fn(cfg)
+        return memo[fn]
+
+    return wrapper
@@ -4,63 +4,102 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import os
 import sys
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+import yaml
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 if SCRIPT_DIR not in sys.path:
     sys.path.insert(0, SCRIPT_DIR)
 
+from config_cache import cached_file_load, cached_load, per_cfg  # type: ignore
 from config_validate import (  # type: ignore
     CODEX_EFFORT_VALUES,
     SERVANT_NAMES,
     TIMEOUT_MODE_VALUES,
     ValidationError,
+    allowed_model_sets,
     load_and_validate_split_config,
     load_manifest_if_present,
     validate_manifest_extensions,
 )
+from json_io import dumps_compact_bytes, write_json_stdout  # type: ignore
 
 DISPATCH_ALLOWED_FLAGS = {
-    "impl": {"enable_brief", "enable_verify", "enable_review"},
-    "review": {"enable_verify", "enable_review"},
+    "impl": frozenset({"enable_brief", "enable_verify", "enable_review"}),
+    "review": frozenset({"enable_verify", "enable_review"}),
+}
+
+DISPATCH_ALLOWED_OPTIONS = {
+    "impl": frozenset({"impl_mode", "timeout_mode"}),
+    "review": frozenset({"review_mode", "timeout_mode", "security_mode"}),
 }
 
-PURPOSE_NAMES = {"impl", "review", "verify", "plan", "one_shot"}
+MANIFEST_RESOLVE_KEYS = ("routing",)
 
+PURPOSE_NAMES = frozenset({"impl", "review", "verify", "plan", "one_shot"})
 
-def _stage_tool(stage_name: str) -> str:
+_IMPL_ROLES = frozenset({"impl", "test_impl"})
+_VERIFY_ROLES = frozenset({"verify", "static_verify"})
+_BRIEF_ROLES = frozenset({"brief", "test_design"})
+
+
+class _StageMeta(NamedTuple):
+    tool: str
+    role: str
+    is_brief: bool
+    has_verify: bool
+    has_review: bool
+
+
+@functools.lru_cache(maxsize=256)
+def _stage_meta(stage_name: str) -> _StageMeta:
+    # Invalid names raise, and lru_cache does not cache exceptions.
     if "_" not in stage_name:
         raise ValidationError(f"stage '{stage_name}' must include tool prefix")
-    tool = stage_name.split("_", 1)[0]
+    tool, role = stage_name.split("_", 1)
     if tool not in SERVANT_NAMES:
         raise ValidationError(f"stage '{stage_name}' starts with unknown tool '{tool}'")
-    return tool
+    return _StageMeta(
+        tool=tool,
+        role=role,
+        is_brief=stage_name.endswith("_brief"),
+        has_verify="verify" in role,
+        has_review="review" in role,
+    )
+
+
+def _stage_tool(stage_name: str) -> str:
+    return _stage_meta(stage_name).tool
 
 
-def _dispatch_stage_purpose(stage: str, pipeline: str, options: Dict[str, Any]) -> str:
-    role = stage.split("_", 1)[1] if "_" in stage else stage
+def _dispatch_stage_purpose(
+    meta: _StageMeta, pipeline: str, options: Dict[str, Any]
+) -> str:
+    role = meta.role
     impl_mode = options.get("impl_mode")
 
-    if role in {"impl", "test_impl"}:
+    if role in _IMPL_ROLES:
         return "impl"
-    if role in {"verify", "static_verify"}:
+    if role in _VERIFY_ROLES:
         return "verify"
-    if "review" in role:
+    if meta.has_review:
         return "review"
     if role == "runbook":
         return "one_shot"
-    if role in {"brief", "test_design"}:
+    if role in _BRIEF_ROLES:
         if pipeline == "impl" and impl_mode == "one_shot":
             return "one_shot"
         return "plan"
     return "plan" if pipeline == "impl" else "review"
 
 
-def _plan_stage_purpose(stage: str) -> str:
-    if "review" in stage:
+def _plan_stage_purpose(meta: _StageMeta) -> str:
+    if meta.has_review:
         return "review"
     return "plan"
 
@@ -84,46 +123,68 @@ def _base_profile_from_intent(cfg: Dict[str, Any], intent: str) -> Tuple[str, st
 
 
 def _merge_dict(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-    out = dict(base)
-    out.update(override)
-    return out
+    # Config nodes are treated as read-only, so an empty override can share base.
+    if not override:
+        return base
+    return {**base, **override}
 
 
-def _profile_data(cfg: Dict[str, Any], pipeline: str, profile: str) -> Dict[str, Any]:
+class _ProfileRuntime(NamedTuple):
+    stages: List[str]
+    flags: Dict[str, bool]
+    options: Dict[str, str]
+    stage_models: Dict[str, str]
+    stage_efforts: Dict[str, str]
+
+
+def _profile_data(cfg: Dict[str, Any], pipeline: str, profile: str) -> _ProfileRuntime:
     profiles = cfg["pipelines"][pipeline]["profiles"]
     if profile not in profiles:
         raise ValidationError(
             f"pipeline '{pipeline}' does not define profile '{profile}'"
         )
     node = profiles[profile]
-    return {
-        "stages": list(node.get("stages") or []),
-        "flags": dict(node.get("flags") or {}),
-        "options": dict(node.get("options") or {}),
-        "stage_models": dict(node.get("stage_models") or {}),
-        "stage_efforts": dict(node.get("stage_efforts") or {}),
-    }
+    return _ProfileRuntime(
+        stages=node.get("stages") or [],
+        flags=node.get("flags") or {},
+        options=node.get("options") or {},
+        stage_models=node.get("stage_models") or {},
+        stage_efforts=node.get("stage_efforts") or {},
+    )
 
 
 def _apply_dispatch_flag_filters(
     stages: List[str], flags: Dict[str, bool]
 ) -> List[str]:
-    out = list(stages)
-    if flags.get("enable_brief") is False:
-        out = [s for s in out if not s.endswith("_brief")]
-    if flags.get("enable_verify") is False:
-        out = [s for s in out if "verify" not in s.split("_", 1)[1]]
-    if flags.get("enable_review") is False:
-        out = [s for s in out if "review" not in s.split("_", 1)[1]]
+    drop_brief = flags.get("enable_brief") is False
+    drop_verify = flags.get("enable_verify") is False
+    drop_review = flags.get("enable_review") is False
+    if not (drop_brief or drop_verify or drop_review):
+        return stages
+
+    out: List[str] = []
+    for s in stages:
+        meta = _stage_meta(s)
+        if drop_brief and meta.is_brief:
+            continue
+        if drop_verify and meta.has_verify:
+            continue
+        if drop_review and meta.has_review:
+            continue
+        out.append(s)
     return out
 
 
+@per_cfg
+def _default_tool_models(cfg: Dict[str, Any]) -> Dict[str, str]:
+    servants = cfg["servants"]
+    return {tool: servants[tool]["default_model"] for tool in SERVANT_NAMES}
+
+
 def _resolve_tool_models(
     cfg: Dict[str, Any], manifest: Optional[Dict[str, Any]]
 ) -> Dict[str, str]:
-    models: Dict[str, str] = {}
-    for tool in SERVANT_NAMES:
-        models[tool] = cfg["servants"][tool]["default_model"]
+    models = dict(_default_tool_models(cfg))
 
     routing = (manifest or {}).get("routing") or {}
     model_override = routing.get("model") or {}
@@ -134,13 +195,16 @@ def _resolve_tool_models(
     return models
 
 
+@per_cfg
 def _resolve_purpose_models(cfg: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+    servants = cfg["servants"]
+    allowed_sets = allowed_model_sets(cfg)
     purpose_models: Dict[str, Dict[str, str]] = {}
     for tool in SERVANT_NAMES:
-        raw = cfg["servants"][tool].get("purpose_models") or {}
+        raw = servants[tool].get("purpose_models") or {}
         if not isinstance(raw, dict):
             raise ValidationError(f"servants.{tool}.purpose_models must be a mapping")
-        allowed = cfg["servants"][tool]["allowed_models"]
+        allowed = allowed_sets[tool]
         for purpose_name, model in raw.items():
             if purpose_name not in PURPOSE_NAMES:
                 raise ValidationError(
@@ -154,6 +218,7 @@ def _resolve_purpose_models(cfg: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
     return purpose_models
 
 
+@per_cfg
 def _resolve_codex_purpose_efforts(cfg: Dict[str, Any]) -> Dict[str, str]:
     raw = cfg["servants"]["codex"].get("purpose_efforts") or {}
     if not isinstance(raw, dict):
@@ -170,21 +235,87 @@ def _resolve_codex_purpose_efforts(cfg: Dict[str, Any]) -> Dict[str, str]:
     return dict(raw)
 
 
+@per_cfg
 def _resolve_tool_wrapper_defaults(cfg: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    servants = cfg["servants"]
     out: Dict[str, Dict[str, Any]] = {}
     for tool in SERVANT_NAMES:
-        raw = cfg["servants"][tool].get("wrapper_defaults") or {}
+        raw = servants[tool].get("wrapper_defaults") or {}
         if not isinstance(raw, dict):
             raise ValidationError(f"servants.{tool}.wrapper_defaults must be a mapping")
         out[tool] = dict(raw)
     return out
 
 
+@per_cfg
+def _tool_timeout_ms(cfg: Dict[str, Any]) -> Dict[str, int]:
+    wrapper_defaults = _resolve_tool_wrapper_defaults(cfg)
+    out: Dict[str, int] = {}
+    for tool in SERVANT_NAMES:
+        raw_timeout_ms = wrapper_defaults[tool].get("timeout_ms")
+        if not isinstance(raw_timeout_ms, int) or raw_timeout_ms < 0:
+            raise ValidationError(
+                f"servants.{tool}.wrapper_defaults.timeout_ms must be a non-negative integer"
+            )
+        out[tool] = raw_timeout_ms
+    return out
+
+
+def _check_timeout_modes(
+    stages: List[str], tool_timeout_modes: Dict[str, Any], label: str
+) -> None:
+    # Modes are per tool, so check each tool once up front; the error still
+    # names the first stage that would have used the invalid mode.
+    if all(mode in TIMEOUT_MODE_VALUES for mode in tool_timeout_modes.values()):
+        return
+    for stage_name in stages:
+        mode = tool_timeout_modes[_stage_tool(stage_name)]
+        if mode not in TIMEOUT_MODE_VALUES:
+            raise ValidationError(
+                f"resolved timeout_mode '{mode}' is invalid for {label} '{stage_name}'"
+            )
+
+
+@per_cfg
+def _checked_profiles(cfg: Dict[str, Any]) -> Set[Tuple[str, str]]:
+    # Filled in by _check_profile_overrides; the one mutable per-cfg memo.
+    return set()
+
+
+def _check_profile_overrides(
+    cfg: Dict[str, Any], pipeline: str, profile: str, runtime: _ProfileRuntime
+) -> None:
+    checked = _checked_profiles(cfg)
+    if (pipeline, profile) in checked:
+        return
+
+    allowed_sets = allowed_model_sets(cfg)
+    for stage_name, stage_model in runtime.stage_models.items():
+        tool = _stage_tool(stage_name)
+        if stage_model not in allowed_sets[tool]:
+            raise ValidationError(
+                f"profile '{profile}' stage_models.{stage_name}='{stage_model}' is not allowed for {tool}"
+            )
+
+    for stage_name, stage_effort in runtime.stage_efforts.items():
+        tool = _stage_tool(stage_name)
+        if tool != "codex":
+            raise ValidationError(
+                f"profile '{profile}' stage_efforts.{stage_name} is only supported for codex stages"
+            )
+        if stage_effort not in CODEX_EFFORT_VALUES:
+            raise ValidationError(
+                f"profile '{profile}' stage_efforts.{stage_name}='{stage_effort}' is invalid"
+            )
+
+    checked.add((pipeline, profile))
+
+
 def resolve_dispatch(
     cfg: Dict[str, Any], manifest: Dict[str, Any], plan_name: str, intent_default: str
 ) -> Dict[str, Any]:
     routing = manifest.get("routing") or {}
-    routing_model_overrides = dict(routing.get("model") or {})
+    routing_model_overrides = routing.get("model") or {}
     requested_intent = routing.get("intent") or intent_default
     if plan_name != "auto":
         requested_intent = plan_name
@@ -194,27 +325,26 @@ def resolve_dispatch(
     pipeline_override = routing.get("pipeline") or {}
     profile_override = pipeline_override.get("profile")
 
-    selected_profile = profile_override or profile_from_intent
-    profile_runtime = _profile_data(cfg, pipeline, selected_profile)
+    base_profile = profile_override or profile_from_intent
+    selected_profile = base_profile
+    profile_runtime = _profile_data(cfg, pipeline, base_profile)
 
-    flags_override = dict(pipeline_override.get("flags") or {})
-    options_override = dict(pipeline_override.get("options") or {})
+    flags_override = pipeline_override.get("flags") or {}
+    options_override = pipeline_override.get("options") or {}
 
-    runtime_flags = _merge_dict(profile_runtime["flags"], flags_override)
-    runtime_options = _merge_dict(profile_runtime["options"], options_override)
+    runtime_flags = _merge_dict(profile_runtime.flags, flags_override)
+    runtime_options = _merge_dict(profile_runtime.options, options_override)
 
-    unsupported_flags = sorted(
-        set(runtime_flags.keys()) - DISPATCH_ALLOWED_FLAGS[pipeline]
-    )
+    allowed_flags = DISPATCH_ALLOWED_FLAGS[pipeline]
+    unsupported_flags = sorted(k for k in runtime_flags if k not in allowed_flags)
     if unsupported_flags:
         raise ValidationError(
             f"pipeline '{pipeline}' does not support flags: {', '.join(unsupported_flags)}"
         )
 
+    allowed_options = DISPATCH_ALLOWED_OPTIONS[pipeline]
     if pipeline == "impl":
-        unsupported = sorted(
-            set(runtime_options.keys()) - {"impl_mode", "timeout_mode"}
-        )
+        unsupported = sorted(k for k in runtime_options if k not in allowed_options)
         if unsupported:
             raise ValidationError(
                 f"pipeline '{pipeline}' does not support options: {', '.join(unsupported)}"
@@ -227,10 +357,7 @@ def resolve_dispatch(
             selected_profile = "one_shot_impl"
 
     if pipeline == "review":
-        unsupported = sorted(
-            set(runtime_options.keys())
-            - {"review_mode", "timeout_mode", "security_mode"}
-        )
+        unsupported = sorted(k for k in runtime_options if k not in allowed_options)
         if unsupported:
             raise ValidationError(
                 f"pipeline '{pipeline}' does not support options: {', '.join(unsupported)}"
@@ -241,12 +368,14 @@ def resolve_dispatch(
         elif review_mode == "cross":
             selected_profile = "review_cross"
 
-    if selected_profile != (profile_override or profile_from_intent):
+    # impl_mode/review_mode usually name the profile already selected; only a
+    # different profile needs its own flags/options merged.
+    if selected_profile != base_profile:
         profile_runtime = _profile_data(cfg, pipeline, selected_profile)
-        runtime_flags = _merge_dict(profile_runtime["flags"], flags_override)
-        runtime_options = _merge_dict(profile_runtime["options"], options_override)
+        runtime_flags = _merge_dict(profile_runtime.flags, flags_override)
+        runtime_options = _merge_dict(profile_runtime.options, options_override)
 
-    stage_plan = _apply_dispatch_flag_filters(profile_runtime["stages"], runtime_flags)
+    stage_plan = _apply_dispatch_flag_filters(profile_runtime.stages, runtime_flags)
     if not stage_plan:
         raise ValidationError("resolved dispatch stage plan is empty")
 
@@ -263,34 +392,27 @@ def resolve_dispatch(
             f"pipeline '{pipeline}' timeout_mode='{timeout_mode_override}' is invalid"
         )
 
-    profile_stage_models = profile_runtime["stage_models"]
-    for stage_name, stage_model in profile_stage_models.items():
-        tool = _stage_tool(stage_name)
-        allowed = cfg["servants"][tool]["allowed_models"]
-        if stage_model not in allowed:
-            raise ValidationError(
-                f"profile '{selected_profile}' stage_models.{stage_name}='{stage_model}' is not allowed for {tool}"
-            )
+    profile_stage_models = profile_runtime.stage_models
+    profile_stage_efforts = profile_runtime.stage_efforts
+    _check_profile_overrides(cfg, pipeline, selected_profile, profile_runtime)
 
-    profile_stage_efforts = profile_runtime["stage_efforts"]
-    for stage_name, stage_effort in profile_stage_efforts.items():
-        tool = _stage_tool(stage_name)
-        if tool != "codex":
-            raise ValidationError(
-                f"profile '{selected_profile}' stage_efforts.{stage_name} is only supported for codex stages"
-            )
-        if stage_effort not in CODEX_EFFORT_VALUES:
-            raise ValidationError(
-                f"profile '{selected_profile}' stage_efforts.{stage_name}='{stage_effort}' is invalid"
-            )
+    # Per-tool values are fixed for the whole run; look them up once.
+    tool_timeout_ms = _tool_timeout_ms(cfg)
+    tool_timeout_modes = {
+        tool: timeout_mode_override or wrapper_defaults[tool].get("timeout_mode")
+        for tool in SERVANT_NAMES
+    }
+    _check_timeout_modes(stage_plan, tool_timeout_modes, "stage")
+    codex_default_effort = wrapper_defaults["codex"].get("effort")
 
     stage_models: Dict[str, str] = {}
     stage_efforts: Dict[str, str] = {}
     stage_timeout_ms: Dict[str, int] = {}
     stage_timeout_modes: Dict[str, str] = {}
     for stage_name in stage_plan:
-        tool = _stage_tool(stage_name)
-        stage_purpose = _dispatch_stage_purpose(stage_name, pipeline, runtime_options)
+        meta = _stage_meta(stage_name)
+        tool = meta.tool
+        stage_purpose = _dispatch_stage_purpose(meta, pipeline, runtime_options)
         # Task-level model override is the strongest signal for dispatch.
         stage_model = routing_model_overrides.get(tool)
         if stage_model is None:
@@ -301,29 +423,16 @@ def resolve_dispatch(
                 stage_model = tool_models[tool]
         stage_models[stage_name] = stage_model
 
-        raw_timeout_ms = wrapper_defaults.get(tool, {}).get("timeout_ms")
-        if isinstance(raw_timeout_ms, int) and raw_timeout_ms >= 0:
-            stage_timeout_ms[stage_name] = raw_timeout_ms
-        else:
-            raise ValidationError(
-                f"servants.{tool}.wrapper_defaults.timeout_ms must be a non-negative integer"
-            )
+        stage_timeout_ms[stage_name] = tool_timeout_ms[tool]
 
-        stage_timeout_mode = timeout_mode_override or wrapper_defaults.get(
-            tool, {}
-        ).get("timeout_mode")
-        if stage_timeout_mode not in TIMEOUT_MODE_VALUES:
-            raise ValidationError(
-                f"resolved timeout_mode '{stage_timeout_mode}' is invalid for stage '{stage_name}'"
-            )
-        stage_timeout_modes[stage_name] = stage_timeout_mode
+        stage_timeout_modes[stage_name] = tool_timeout_modes[tool]
 
         if tool == "codex":
             stage_effort = profile_stage_efforts.get(stage_name)
             if stage_effort is None:
                 stage_effort = codex_purpose_efforts.get(stage_purpose)
             if stage_effort is None:
-                stage_effort = wrapper_defaults.get("codex", {}).get("effort")
+                stage_effort = codex_default_effort
             if stage_effort not in CODEX_EFFORT_VALUES:
                 raise ValidationError(
                     f"resolved codex effort '{stage_effort}' is invalid for stage '{stage_name}'"
@@ -363,9 +472,7 @@ def resolve_plan_pipeline(
     profile_stage_models = dict(profile.get("stage_models") or {})
     profile_stage_efforts = dict(profile.get("stage_efforts") or {})
 
-    tool_models: Dict[str, str] = {}
-    for tool in SERVANT_NAMES:
-        tool_models[tool] = cfg["servants"][tool]["default_model"]
+    tool_models = dict(_default_tool_models(cfg))
     purpose_models = _resolve_purpose_models(cfg)
     codex_purpose_efforts = _resolve_codex_purpose_efforts(cfg)
     wrapper_defaults = _resolve_tool_wrapper_defaults(cfg)
@@ -378,11 +485,11 @@ def resolve_plan_pipeline(
             f"plan profile '{profile_name}' timeout_mode='{timeout_mode_override}' is invalid"
         )
 
+    allowed_sets = allowed_model_sets(cfg)
     for tool, model in model_overrides.items():
         if model is None:
             continue
-        allowed = cfg["servants"][tool]["allowed_models"]
-        if model not in allowed:
+        if model not in allowed_sets[tool]:
             raise ValidationError(
                 f"CLI override model '{model}' is not allowed for {tool}"
             )
@@ -395,8 +502,7 @@ def resolve_plan_pipeline(
             raise ValidationError(
                 f"plan profile stage_models has unknown key '{stage_name}'"
             )
-        allowed = cfg["servants"][tool]["allowed_models"]
-        if stage_model not in allowed:
+        if stage_model not in allowed_sets[tool]:
             raise ValidationError(
                 f"plan profile '{profile_name}' stage_models.{stage_name}='{stage_model}' is not allowed for {tool}"
             )
@@ -426,17 +532,27 @@ def resolve_plan_pipeline(
         "copilot_consolidate",
     ]
 
+    # Per-tool values are fixed for the whole run; look them up once.
+    tool_timeout_ms = _tool_timeout_ms(cfg)
+    tool_timeout_modes = {
+        tool: timeout_mode_override or wrapper_defaults[tool].get("timeout_mode")
+        for tool in SERVANT_NAMES
+    }
+    _check_timeout_modes(stage_order, tool_timeout_modes, "plan stage")
+    codex_default_effort = wrapper_defaults["codex"].get("effort")
+
     stage_models: Dict[str, str] = {}
     stage_efforts: Dict[str, str] = {}
     stage_timeout_ms: Dict[str, int] = {}
     stage_timeout_modes: Dict[str, str] = {}
     for stage_name in stage_order:
-        tool = _stage_tool(stage_name)
+        meta = _stage_meta(stage_name)
+        tool = meta.tool
+        stage_purpose = _plan_stage_purpose(meta)
 
         # CLI model override is the strongest signal for plan pipeline runs.
         stage_model = model_overrides.get(tool)
         if stage_model is None:
-            stage_purpose = _plan_stage_purpose(stage_name)
             stage_model = profile_stage_models.get(stage_name)
             if stage_model is None:
                 stage_model = purpose_models.get(tool, {}).get(stage_purpose)
@@ -444,30 +560,16 @@ def resolve_plan_pipeline(
                 stage_model = tool_models[tool]
         stage_models[stage_name] = stage_model
 
-        raw_timeout_ms = wrapper_defaults.get(tool, {}).get("timeout_ms")
-        if isinstance(raw_timeout_ms, int) and raw_timeout_ms >= 0:
-            stage_timeout_ms[stage_name] = raw_timeout_ms
-        else:
-            raise ValidationError(
-                f"servants.{tool}.wrapper_defaults.timeout_ms must be a non-negative integer"
-            )
+        stage_timeout_ms[stage_name] = tool_timeout_ms[tool]
 
-        stage_timeout_mode = timeout_mode_override or wrapper_defaults.get(
-            tool, {}
-        ).get("timeout_mode")
-        if stage_timeout_mode not in TIMEOUT_MODE_VALUES:
-            raise ValidationError(
-                f"resolved timeout_mode '{stage_timeout_mode}' is invalid for plan stage '{stage_name}'"
-            )
-        stage_timeout_modes[stage_name] = stage_timeout_mode
+        stage_timeout_modes[stage_name] = tool_timeout_modes[tool]
 
         if tool == "codex":
-            stage_purpose = _plan_stage_purpose(stage_name)
             stage_effort = profile_stage_efforts.get(stage_name)
             if stage_effort is None:
                 stage_effort = codex_purpose_efforts.get(stage_purpose)
             if stage_effort is None:
-                stage_effort = wrapper_defaults.get("codex", {}).get("effort")
+                stage_effort = codex_default_effort
             if stage_effort not in CODEX_EFFORT_VALUES:
                 raise ValidationError(
                     f"resolved codex effort '{stage_effort}' is invalid for plan stage '{stage_name}'"
@@ -487,6 +589,96 @@ def resolve_plan_pipeline(
     }
 
 
+def _cached_load(config_root: str) -> Dict[str, Any]:
+    return cached_load("split-config", config_root, load_and_validate_split_config)
+
+
+def _load_manifest_routing(path: str) -> Optional[Dict[str, Any]]:
+    # Task manifests carry much more than routing; keep only what dispatch
+    # validation/resolution reads so cached entries stay small.
+    manifest = load_manifest_if_present(path)
+    if manifest is None:
+        return None
+    return {key: manifest[key] for key in MANIFEST_RESOLVE_KEYS if key in manifest}
+
+
+def _load_manifest(path: Optional[str]) -> Optional[Dict[str, Any]]:
+    if not path:
+        return None
+    return cached_file_load("manifest-routing", path, _load_manifest_routing)
+
+
+def _resolve_mode(
+    cfg: Dict[str, Any],
+    mode: str,
+    manifest_path: Optional[str] = None,
+    plan_name: str = "auto",
+    intent_default: str = "safe_impl",
+    profile: Optional[str] = None,
+    model_overrides: Optional[Dict[str, Optional[str]]] = None,
+) -> Dict[str, Any]:
+    if mode == "dispatch":
+        manifest = _load_manifest(manifest_path)
+        if manifest is None:
+            raise ValidationError("manifest is required for dispatch resolution")
+        validate_manifest_extensions(cfg, manifest, manifest_path=manifest_path)
+        return resolve_dispatch(cfg, manifest, plan_name, intent_default)
+    if mode == "plan":
+        return resolve_plan_pipeline(cfg, profile, model_overrides or {})
+    raise ValidationError(f"unknown resolve mode '{mode}'")
+
+
+def _serve(config_root: str) -> int:
+    """Answer newline-delimited JSON requests from stdin until EOF.
+
+    Request:  {"mode": "dispatch", "manifest": ..., "plan_name": ..., "intent_default": ...}
+              {"mode": "plan", "profile": ..., "copilot_model": ..., "gemini_model": ..., "codex_model": ...}
+    Response: {"ok": true, "resolved": {...}} or {"ok": false, "error": "..."},
+              echoing "id" when the request carries one.
+
+    The validated config stays in memory and is reloaded when its files change.
+    """
+    out = sys.stdout.buffer
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        response: Dict[str, Any]
+        req: Any = None
+        try:
+            req = json.loads(line)
+            if not isinstance(req, dict):
+                raise ValidationError("request must be a JSON object")
+            cfg = _cached_load(config_root)
+            resolved = _resolve_mode(
+                cfg,
+                req.get("mode"),
+                manifest_path=req.get("manifest"),
+                plan_name=req.get("plan_name") or "auto",
+                intent_default=req.get("intent_default") or "safe_impl",
+                profile=req.get("profile"),
+                model_overrides={
+                    tool: req.get(f"{tool}_model")
+                    for tool in ("copilot", "gemini", "codex")
+                },
+            )
+            response = {"ok": True, "resolved": resolved}
+        except ValidationError as e:
+            response = {"ok": False, "error": str(e)}
+        except (TypeError, ValueError) as e:
+            response = {"ok": False, "error": f"invalid request: {e}"}
+        except yaml.YAMLError as e:
+            response = {"ok": False, "error": f"YAML parse failed: {e}"}
+        except OSError as e:
+            # e.g. an unreadable manifest; one bad request must not end the loop.
+            response = {"ok": False, "error": f"cannot read input: {e}"}
+        if isinstance(req, dict) and "id" in req:
+            response["id"] = req["id"]
+        out.write(dumps_compact_bytes(response))
+        out.write(b"\n")
+        out.flush()
+    return 0
+
+
 def _main() -> int:
     parser = argparse.ArgumentParser(description="Resolve runtime config")
     sub = parser.add_subparsers(dest="mode", required=True)
@@ -511,18 +703,26 @@ def _main() -> int:
     p_plan.add_argument("--gemini-model")
     p_plan.add_argument("--codex-model")
 
+    p_serve = sub.add_parser(
+        "serve", help="Resolve newline-delimited JSON requests from stdin"
+    )
+    add_source_args(p_serve)
+
     args = parser.parse_args()
 
+    if args.mode == "serve":
+        return _serve(args.config_root)
+
     try:
-        cfg = load_and_validate_split_config(args.config_root)
+        cfg = _cached_load(args.config_root)
 
         if args.mode == "dispatch":
-            manifest = load_manifest_if_present(args.manifest)
-            if manifest is None:
-                raise ValidationError("manifest is required for dispatch resolution")
-            validate_manifest_extensions(cfg, manifest, manifest_path=args.manifest)
-            resolved = resolve_dispatch(
-                cfg, manifest, args.plan_name, args.intent_default
+            resolved = _resolve_mode(
+                cfg,
+                "dispatch",
+                manifest_path=args.manifest,
+                plan_name=args.plan_name,
+                intent_default=args.intent_default,
             )
         else:
             model_overrides = {
@@ -530,14 +730,16 @@ def _main() -> int:
                 "gemini": args.gemini_model,
                 "codex": args.codex_model,
             }
-            resolved = resolve_plan_pipeline(cfg, args.profile, model_overrides)
+            resolved = _resolve_mode(
+                cfg, "plan", profile=args.profile, model_overrides=model_overrides
+            )
 
     except ValidationError as e:
-        print(f"CONFIG RESOLVE ERROR: {e}", file=sys.stderr)
+        for message in str(e).splitlines():
+            print(f"CONFIG RESOLVE ERROR: {message}", file=sys.stderr)
         return 1
 
-    json.dump(resolved, sys.stdout, indent=2, sort_keys=True)
-    print("")
+    write_json_stdout(resolved)
     return 0
 
 
@@ -4,7 +4,6 @@
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import sys
 from typing import Any, Dict, Optional
@@ -13,6 +12,7 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 if SCRIPT_DIR not in sys.path:
     sys.path.insert(0, SCRIPT_DIR)
 
+from config_cache import cached_file_load, cached_load  # type: ignore
 from config_validate_v2 import (  # type: ignore
     PHASES,
     TOOL_WEB_MODE_MAP,
@@ -22,6 +22,7 @@ from config_validate_v2 import (  # type: ignore
     load_manifest_if_present,
     parse_manifest_v2_overrides,
 )
+from json_io import write_json_stdout  # type: ignore
 
 
 def _resolve_selected_method(
@@ -117,16 +118,19 @@ def resolve_v2(
     selected_method_id = _resolve_selected_method(cfg, phase, phase_override, method_id)
 
     method_node = cfg["skills"][phase]["methods"][selected_method_id]
-    resolved_steps = list(method_node.get("steps") or [])
-    if not resolved_steps:
+    method_steps = method_node.get("steps") or []
+    if not method_steps:
         raise ValidationError(f"resolved method '{selected_method_id}' has no steps")
 
+    # A single requested step is the only one resolved; siblings are skipped.
     if step_id:
-        if step_id not in resolved_steps:
+        if step_id not in method_steps:
             raise ValidationError(
                 f"step_id '{step_id}' is not part of resolved method '{selected_method_id}'"
             )
         resolved_steps = [step_id]
+    else:
+        resolved_steps = list(method_steps)
 
     step_map: Dict[str, Dict[str, Any]] = {}
     for sid in resolved_steps:
@@ -152,6 +156,16 @@ def resolve_v2(
     }
 
 
+def _cached_load(config_root: str) -> Dict[str, Any]:
+    return cached_load("v2-config", config_root, load_and_validate_v2_config)
+
+
+def _load_manifest(path: Optional[str]) -> Optional[Dict[str, Any]]:
+    if not path:
+        return None
+    return cached_file_load("manifest-v2", path, load_manifest_if_present)
+
+
 def _main() -> int:
     parser = argparse.ArgumentParser(description="Resolve effective Config V2 values")
     parser.add_argument(
@@ -173,8 +187,8 @@ def _main() -> int:
     args = parser.parse_args()
 
     try:
-        cfg = load_and_validate_v2_config(args.config_root)
-        manifest = load_manifest_if_present(args.manifest)
+        cfg = _cached_load(args.config_root)
+        manifest = _load_manifest(args.manifest)
         manifest_overrides = parse_manifest_v2_overrides(
             cfg,
             manifest,
@@ -191,8 +205,7 @@ def _main() -> int:
         print(f"CONFIG V2 RESOLVE ERROR: {e}", file=sys.stderr)
         return 1
 
-    json.dump(resolved, sys.stdout, indent=2, sort_keys=True)
-    print("")
+    write_json_stdout(resolved)
     return 0
 
 
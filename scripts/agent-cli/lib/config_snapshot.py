@@ -4,12 +4,24 @@
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import functools
+import hashlib
+import io
 import json
 import os
-import tempfile
-from typing import Any, Dict, List, Tuple
+import re
+import threading
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple
 
 import yaml
+from config_cache import (  # type: ignore
+    cache_enabled,
+    cached_load,
+    config_fingerprint,
+    stamp_matches,
+    write_stamp,
+)
 from config_validate import (  # type: ignore
     ValidationError,
     _servant_subdir,
@@ -17,106 +29,239 @@ from config_validate import (  # type: ignore
     load_and_validate_split_config,
 )
 
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Inline JSON for markdown lines: one preconfigured encoder, no per-call kwargs.
+_dumps = json.JSONEncoder(ensure_ascii=False).encode
+
+# Pre-split snapshot names removed on every sync. Unlinking each name directly
+# costs one syscall per name, fewer than listing the config root would.
+_LEGACY_SNAPSHOTS = ("orchestrator.yaml", "orchestrator.md")
+
+# Display order for sections and purpose_models/purpose_efforts entries.
+_SERVANT_ORDER = ("codex", "gemini", "copilot")
+_PIPELINE_ORDER = ("impl", "review", "plan")
+_PURPOSES = ("impl", "review", "verify", "plan", "one_shot")
+
+# Fixed markdown blocks, filled with str.format where they vary per section.
+_PROVIDER_HEAD = (
+    "### `{tool}`\n"
+    "- Edit file: [configs/{subdir}/{tool}.yaml]({subdir}/{tool}.yaml)\n"
+    "- `default_model`: `{default_model}`\n"
+    "- `wrapper_defaults`: `{wrapper}`\n"
+    "- `allowed_models`:\n"
+)
+_PIPELINE_HEAD = (
+    "### `{name}`\n"
+    "- Edit file: [configs/pipeline/{name}-pipeline.yaml](pipeline/{name}-pipeline.yaml)\n"
+    "- `default_profile`: `{default_profile}`\n"
+)
+_CHOICES_HEAD = (
+    "## Configurable Options (Current Allowed Values)\n"
+    "\n"
+    "- `codex_effort`: `{codex_effort}`\n"
+    "- `gemini_approval_mode`: `{gemini_approval_mode}`\n"
+    "- `timeout_mode`: `{timeout_mode}`\n"
+    "\n"
+    "### Pipeline Options\n"
+)
+_MARKDOWN_FOOTER = (
+    "## Validation Command\n"
+    "\n"
+    "```bash\n"
+    "python3 scripts/agent-cli/lib/config_validate.py --config-root configs\n"
+    "python3 scripts/agent-cli/lib/config_validate.py --config-root configs --print-choices\n"
+    "```\n"
+)
+
+# Strings the fast emitter may write unquoted; anything else goes through PyYAML.
+_PLAIN_STR = re.compile(r"[A-Za-z0-9_][A-Za-z0-9_.\-/]{0,63}\Z")
+_YAML_RESOLVER = yaml.resolver.Resolver()
+_YAML_STR_TAG = "tag:yaml.org,2002:str"
+
+
+class _FastYamlUnsupported(Exception):
+    pass
+
+
+def _open_exclusive(path: str) -> int:
+    # O_EXCL never opens through an existing entry (a leftover temp file or a
+    # planted symlink); such an entry is removed and creation retried once.
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+    try:
+        return os.open(path, flags, 0o666)
+    except FileExistsError:
+        os.unlink(path)
+        return os.open(path, flags, 0o666)
+
 
 def _write_atomic(path: str, content: str) -> None:
-    directory = os.path.dirname(os.path.abspath(path))
+    abs_path = os.path.abspath(path)
+    directory = os.path.dirname(abs_path)
     os.makedirs(directory, exist_ok=True)
-    fd, tmp = tempfile.mkstemp(
-        prefix=".cfgsnapshot.", suffix=".tmp", dir=directory, text=True
-    )
+    # Per-process, per-thread name in the target directory: os.replace stays
+    # atomic, the yaml/md writer threads never share a temp file, and there is
+    # no mkstemp random-name loop.
+    name = os.path.basename(abs_path)
+    tmp = os.path.join(directory, f".{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    fd = _open_exclusive(tmp)
+    renamed = False
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            f.write(content)
+        try:
+            # One unbuffered write(2) for the whole file instead of 8 KiB chunks.
+            view = memoryview(content.encode("utf-8"))
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
         os.replace(tmp, path)
+        renamed = True
     finally:
-        try:
-            if os.path.exists(tmp):
+        if not renamed:
+            try:
                 os.unlink(tmp)
-        except OSError:
-            pass
+            except OSError:
+                pass
 
 
-def _dump_yaml(cfg: Dict[str, Any], servant_subdir: str = "servant") -> str:
-    header = (
+@functools.lru_cache(maxsize=None)
+def _yaml_header(servant_subdir: str) -> str:
+    return (
         "# AUTO-GENERATED FILE. DO NOT EDIT.\n"
         "# Runtime source of truth is split config under:\n"
         f"#   - configs/{servant_subdir}/*.yaml\n"
         "#   - configs/pipeline/*.yaml\n"
         "# This file is a read-only snapshot for humans.\n"
     )
-    body = yaml.safe_dump(cfg, sort_keys=False, allow_unicode=False)
+
+
+def _dump_yaml(cfg: Dict[str, Any], servant_subdir: str = "servant") -> str:
+    header = _yaml_header(servant_subdir)
+    try:
+        buf = io.StringIO()
+        _emit_yaml_mapping(buf.write, cfg, 0)
+        body = buf.getvalue()
+    except _FastYamlUnsupported:
+        body = yaml.dump(cfg, Dumper=_YAML_DUMPER, sort_keys=False, allow_unicode=False)
     return header + body
 
 
+def _plain_scalar(value: Any) -> str:
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, int):
+        return str(value)
+    if (
+        isinstance(value, str)
+        and _PLAIN_STR.match(value)
+        and _YAML_RESOLVER.resolve(yaml.ScalarNode, value, (True, False))
+        == _YAML_STR_TAG
+    ):
+        return value
+    raise _FastYamlUnsupported
+
+
+def _emit_yaml_mapping(
+    w: Callable[[str], Any], node: Dict[str, Any], indent: int
+) -> None:
+    """Emit block-style YAML exactly as yaml.safe_dump(sort_keys=False) would.
+
+    Covers the shapes a validated config has (nested mappings, lists of plain
+    scalars); raises _FastYamlUnsupported for anything that PyYAML would
+    quote, fold or emit differently.
+    """
+    if not node:
+        raise _FastYamlUnsupported
+    pad = " " * indent
+    for key, value in node.items():
+        if not isinstance(key, str):
+            raise _FastYamlUnsupported
+        k = _plain_scalar(key)
+        if isinstance(value, dict):
+            if value:
+                w(f"{pad}{k}:\n")
+                _emit_yaml_mapping(w, value, indent + 2)
+            else:
+                w(f"{pad}{k}: {{}}\n")
+        elif isinstance(value, list):
+            if value:
+                w(f"{pad}{k}:\n")
+                for item in value:
+                    w(f"{pad}- {_plain_scalar(item)}\n")
+            else:
+                w(f"{pad}{k}: []\n")
+        else:
+            w(f"{pad}{k}: {_plain_scalar(value)}\n")
+
+
 def _provider_section(
-    tool: str, node: Dict[str, Any], servant_subdir: str = "servant"
-) -> str:
-    lines: List[str] = []
-    lines.append(f"### `{tool}`")
-    lines.append(
-        f"- Edit file: [configs/{servant_subdir}/{tool}.yaml]({servant_subdir}/{tool}.yaml)"
+    buf: TextIO, tool: str, node: Dict[str, Any], servant_subdir: str = "servant"
+) -> None:
+    w = buf.write
+    w(
+        _PROVIDER_HEAD.format(
+            tool=tool,
+            subdir=servant_subdir,
+            default_model=node["default_model"],
+            wrapper=_dumps(node.get("wrapper_defaults") or {}),
+        )
     )
-    lines.append(f"- `default_model`: `{node['default_model']}`")
-    wrapper = node.get("wrapper_defaults") or {}
-    lines.append(f"- `wrapper_defaults`: `{json.dumps(wrapper, ensure_ascii=False)}`")
-    lines.append("- `allowed_models`:")
     for m in node.get("allowed_models") or []:
-        lines.append(f"  - `{m}`")
+        w(f"  - `{m}`\n")
     purpose_models = node.get("purpose_models") or {}
     if purpose_models:
-        lines.append("- `purpose_models`:")
-        for purpose in ("impl", "review", "verify", "plan", "one_shot"):
-            if purpose in purpose_models:
-                lines.append(f"  - `{purpose}` -> `{purpose_models[purpose]}`")
+        w("- `purpose_models`:\n")
+        for purpose in _PURPOSES:
+            model = purpose_models.get(purpose)
+            if model is not None:
+                w(f"  - `{purpose}` -> `{model}`\n")
     purpose_efforts = node.get("purpose_efforts") or {}
     if purpose_efforts:
-        lines.append("- `purpose_efforts`:")
-        for purpose in ("impl", "review", "verify", "plan", "one_shot"):
-            if purpose in purpose_efforts:
-                lines.append(f"  - `{purpose}` -> `{purpose_efforts[purpose]}`")
-    return "\n".join(lines)
+        w("- `purpose_efforts`:\n")
+        for purpose in _PURPOSES:
+            effort = purpose_efforts.get(purpose)
+            if effort is not None:
+                w(f"  - `{purpose}` -> `{effort}`\n")
 
 
 def _profile_summary(
-    profile: str, node: Dict[str, Any], pipeline_name: str
-) -> List[str]:
-    lines: List[str] = []
-    lines.append(f"#### `{profile}`")
+    buf: TextIO, profile: str, node: Dict[str, Any], pipeline_name: str
+) -> None:
+    w = buf.write
+    w(f"#### `{profile}`\n")
     stages = node.get("stages") or []
     if pipeline_name in {"impl", "review"}:
-        lines.append(f"- `stages`: `{json.dumps(stages, ensure_ascii=False)}`")
+        w(f"- `stages`: `{_dumps(stages)}`\n")
     flags = node.get("flags") or {}
     options = node.get("options") or {}
     stage_models = node.get("stage_models") or {}
     stage_efforts = node.get("stage_efforts") or {}
-    lines.append(f"- `flags`: `{json.dumps(flags, ensure_ascii=False)}`")
-    lines.append(f"- `options`: `{json.dumps(options, ensure_ascii=False)}`")
+    w(f"- `flags`: `{_dumps(flags)}`\n")
+    w(f"- `options`: `{_dumps(options)}`\n")
     if stage_models:
-        lines.append("- `stage_models`:")
+        w("- `stage_models`:\n")
         for stage, model in stage_models.items():
-            lines.append(f"  - `{stage}` -> `{model}`")
+            w(f"  - `{stage}` -> `{model}`\n")
     if stage_efforts:
-        lines.append("- `stage_efforts`:")
+        w("- `stage_efforts`:\n")
         for stage, effort in stage_efforts.items():
-            lines.append(f"  - `{stage}` -> `{effort}`")
-    return lines
+            w(f"  - `{stage}` -> `{effort}`\n")
 
 
-def _pipeline_section(name: str, node: Dict[str, Any]) -> str:
-    lines: List[str] = []
-    lines.append(f"### `{name}`")
-    lines.append(
-        f"- Edit file: [configs/pipeline/{name}-pipeline.yaml](pipeline/{name}-pipeline.yaml)"
-    )
-    lines.append(f"- `default_profile`: `{node['default_profile']}`")
+def _pipeline_section(buf: TextIO, name: str, node: Dict[str, Any]) -> None:
+    buf.write(_PIPELINE_HEAD.format(name=name, default_profile=node["default_profile"]))
     profiles = node.get("profiles") or {}
     for profile_name, profile_node in profiles.items():
-        lines.extend(_profile_summary(profile_name, profile_node, name))
-    return "\n".join(lines)
+        _profile_summary(buf, profile_name, profile_node, name)
 
 
-def _edit_map_rows(servant_subdir: str = "servant") -> List[Tuple[str, str]]:
-    return [
+@functools.lru_cache(maxsize=None)
+def _edit_map_rows(servant_subdir: str = "servant") -> Tuple[Tuple[str, str], ...]:
+    return (
         (
             "Codex provider settings",
             f"[configs/{servant_subdir}/codex.yaml]({servant_subdir}/codex.yaml)",
@@ -149,85 +294,91 @@ def _edit_map_rows(servant_subdir: str = "servant") -> List[Tuple[str, str]]:
             "Allowed option enums and validation rules",
             "[scripts/agent-cli/lib/config_validate.py](../scripts/agent-cli/lib/config_validate.py)",
         ),
-    ]
+    )
 
 
-def _choices_section(choices: Dict[str, Any]) -> str:
-    enums = choices["enums"]
-    lines: List[str] = []
-    lines.append("## Configurable Options (Current Allowed Values)")
-    lines.append("")
-    lines.append(
-        f"- `codex_effort`: `{json.dumps(enums['codex_effort'], ensure_ascii=False)}`"
-    )
-    lines.append(
-        f"- `gemini_approval_mode`: `{json.dumps(enums['gemini_approval_mode'], ensure_ascii=False)}`"
+@functools.lru_cache(maxsize=None)
+def _markdown_preamble(servant_subdir: str) -> str:
+    # Everything before the config-dependent sections only varies by subdir.
+    rows = "".join([f"| {k} | {v} |\n" for k, v in _edit_map_rows(servant_subdir)])
+    return (
+        "# Config State Snapshot\n"
+        "\n"
+        "> AUTO-GENERATED. DO NOT EDIT.\n"
+        "\n"
+        "This document is a read-only view of current effective split configuration.\n"
+        "Runtime source of truth:\n"
+        f"- `configs/{servant_subdir}/*.yaml`\n"
+        "- `configs/pipeline/*.yaml`\n"
+        "\n"
+        "Snapshot files:\n"
+        "- `configs/config-state.yaml`\n"
+        "- `configs/config-state.md`\n"
+        "\n"
+        "## Where To Change Settings\n"
+        "\n"
+        "| What you want to change | Edit this file |\n"
+        "| --- | --- |\n"
+        f"{rows}"
+        "\n"
     )
-    lines.append(
-        f"- `timeout_mode`: `{json.dumps(enums['timeout_mode'], ensure_ascii=False)}`"
+
+
+def _choices_section(buf: TextIO, choices: Dict[str, Any]) -> None:
+    enums = choices["enums"]
+    w = buf.write
+    w(
+        _CHOICES_HEAD.format(
+            codex_effort=_dumps(enums["codex_effort"]),
+            gemini_approval_mode=_dumps(enums["gemini_approval_mode"]),
+            timeout_mode=_dumps(enums["timeout_mode"]),
+        )
     )
-    lines.append("")
-    lines.append("### Pipeline Options")
     for pipeline, opt_map in enums["pipeline_options"].items():
-        lines.append(f"- `{pipeline}`:")
+        w(f"- `{pipeline}`:\n")
         for opt, vals in opt_map.items():
-            lines.append(f"  - `{opt}`: `{json.dumps(vals, ensure_ascii=False)}`")
-    lines.append("")
-    lines.append("### Pipeline Flags")
+            w(f"  - `{opt}`: `{_dumps(vals)}`\n")
+    w("\n### Pipeline Flags\n")
     for pipeline, flags in enums["pipeline_flags"].items():
-        lines.append(f"- `{pipeline}`: `{json.dumps(flags, ensure_ascii=False)}`")
-    return "\n".join(lines)
+        w(f"- `{pipeline}`: `{_dumps(flags)}`\n")
 
 
 def _render_markdown(cfg: Dict[str, Any], servant_subdir: str = "servant") -> str:
     choices = build_choices_catalog(cfg)
-    lines: List[str] = []
-    lines.append("# Config State Snapshot")
-    lines.append("")
-    lines.append("> AUTO-GENERATED. DO NOT EDIT.")
-    lines.append("")
-    lines.append(
-        "This document is a read-only view of current effective split configuration."
-    )
-    lines.append("Runtime source of truth:")
-    lines.append(f"- `configs/{servant_subdir}/*.yaml`")
-    lines.append("- `configs/pipeline/*.yaml`")
-    lines.append("")
-    lines.append("Snapshot files:")
-    lines.append("- `configs/config-state.yaml`")
-    lines.append("- `configs/config-state.md`")
-    lines.append("")
-    lines.append("## Where To Change Settings")
-    lines.append("")
-    lines.append("| What you want to change | Edit this file |")
-    lines.append("| --- | --- |")
-    for k, v in _edit_map_rows(servant_subdir):
-        lines.append(f"| {k} | {v} |")
-    lines.append("")
-    lines.append(_choices_section(choices))
-    lines.append("")
-    lines.append("## Current Provider State")
-    lines.append("")
-    for tool in ("codex", "gemini", "copilot"):
-        lines.append(_provider_section(tool, cfg["servants"][tool], servant_subdir))
-        lines.append("")
-    lines.append("## Current Pipeline State")
-    lines.append("")
-    for pipeline in ("impl", "review", "plan"):
-        lines.append(_pipeline_section(pipeline, cfg["pipelines"][pipeline]))
-        lines.append("")
-    lines.append("## Validation Command")
-    lines.append("")
-    lines.append("```bash")
-    lines.append(
-        "python3 scripts/agent-cli/lib/config_validate.py --config-root configs"
-    )
-    lines.append(
-        "python3 scripts/agent-cli/lib/config_validate.py --config-root configs --print-choices"
-    )
-    lines.append("```")
-    lines.append("")
-    return "\n".join(lines)
+    buf = io.StringIO()
+    w = buf.write
+    w(_markdown_preamble(servant_subdir))
+    _choices_section(buf, choices)
+    w("\n## Current Provider State\n\n")
+    servants = cfg["servants"]
+    for tool in _SERVANT_ORDER:
+        _provider_section(buf, tool, servants[tool], servant_subdir)
+        w("\n")
+    w("## Current Pipeline State\n\n")
+    pipelines = cfg["pipelines"]
+    for pipeline in _PIPELINE_ORDER:
+        _pipeline_section(buf, pipeline, pipelines[pipeline])
+        w("\n")
+    w(_MARKDOWN_FOOTER)
+    return buf.getvalue()
+
+
+def _snapshot_fingerprint(
+    root: str, servant_subdir: str, outputs: Tuple[str, ...]
+) -> Optional[str]:
+    """Fingerprint of everything the snapshot files are derived from, plus the
+    files themselves so that edited or deleted outputs are regenerated."""
+    try:
+        stats: List[Any] = [
+            config_fingerprint(root, load_and_validate_split_config),
+            servant_subdir,
+        ]
+        for path in (__file__, *outputs):
+            st = os.stat(path)
+            stats.append((os.path.abspath(path), st.st_mtime_ns, st.st_size))
+    except OSError:
+        return None
+    return hashlib.blake2b(repr(stats).encode("utf-8"), digest_size=16).hexdigest()
 
 
 def _main() -> int:
@@ -239,19 +390,43 @@ def _main() -> int:
     parser.add_argument("--md-out", help="Output path for Markdown snapshot")
     args = parser.parse_args()
 
-    cfg = load_and_validate_split_config(args.config_root)
-
     root = os.path.abspath(args.config_root)
     servant_subdir = _servant_subdir(root)
     yaml_out = args.yaml_out or os.path.join(root, "config-state.yaml")
     md_out = args.md_out or os.path.join(root, "config-state.md")
+    outputs = (yaml_out, md_out)
 
-    _write_atomic(yaml_out, _dump_yaml(cfg, servant_subdir))
-    _write_atomic(md_out, _render_markdown(cfg, servant_subdir))
-    for legacy in ("orchestrator.yaml", "orchestrator.md"):
-        legacy_path = os.path.join(root, legacy)
-        if os.path.exists(legacy_path):
-            os.unlink(legacy_path)
+    # config.sh syncs the snapshot before most commands; when neither the
+    # config, this script, nor the outputs changed since the last sync, the
+    # files are already up to date.
+    use_stamp = cache_enabled()
+    stamp_source = "\0".join([root] + [os.path.abspath(p) for p in outputs])
+    fingerprint = (
+        _snapshot_fingerprint(root, servant_subdir, outputs) if use_stamp else None
+    )
+    if fingerprint is None or not stamp_matches("snapshot", stamp_source, fingerprint):
+        cfg = cached_load("split-config", root, load_and_validate_split_config)
+
+        # Rendering holds the GIL; file writes release it. Write the YAML
+        # snapshot in the background while the markdown is rendered.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+            yaml_text = _dump_yaml(cfg, servant_subdir)
+            writes = [pool.submit(_write_atomic, yaml_out, yaml_text)]
+            md_text = _render_markdown(cfg, servant_subdir)
+            writes.append(pool.submit(_write_atomic, md_out, md_text))
+            for fut in writes:
+                fut.result()
+
+        if use_stamp:
+            fingerprint = _snapshot_fingerprint(root, servant_subdir, outputs)
+            if fingerprint is not None:
+                write_stamp("snapshot", stamp_source, fingerprint)
+
+    for legacy in _LEGACY_SNAPSHOTS:
+        try:
+            os.unlink(os.path.join(root, legacy))
+        except FileNotFoundError:
+            pass
     return 0
 
 
@@ -259,4 +434,6 @@ if __name__ == "__main__":
     try:
         raise SystemExit(_main())
     except ValidationError as e:
-        raise SystemExit(f"CONFIG SNAPSHOT ERROR: {e}")
+        raise SystemExit(
+            "\n".join(f"CONFIG SNAPSHOT ERROR: {line}" for line in str(e).splitlines())
+        )
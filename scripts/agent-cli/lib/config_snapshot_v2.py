@@ -4,15 +4,18 @@
 from __future__ import annotations
 
 import argparse
+import io
 import json
 import os
 import sys
-from typing import Any, Dict, List
+import tempfile
+from typing import Any, Dict, TextIO
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 if SCRIPT_DIR not in sys.path:
     sys.path.insert(0, SCRIPT_DIR)
 
+from config_cache import cached_load  # type: ignore
 from config_validate_v2 import (  # type: ignore
     PHASES,
     TOOLS,
@@ -20,133 +23,144 @@ from config_validate_v2 import (  # type: ignore
     load_and_validate_v2_config,
 )
 
+_dumps = json.JSONEncoder(ensure_ascii=False).encode
 
-def _render_skill_phase(phase: str, node: Dict[str, Any]) -> str:
-    lines: List[str] = []
-    lines.append(f"### `{phase}`")
-    lines.append(f"- source: `configs-v2/skills/{phase}.yaml`")
-    lines.append(
-        f"- default_method_ids: `{json.dumps(node.get('default_method_ids') or [], ensure_ascii=False)}`"
-    )
-    lines.append("- methods:")
+
+def _render_skill_phase(buf: TextIO, phase: str, node: Dict[str, Any]) -> None:
+    w = buf.write
+    w(f"### `{phase}`\n")
+    w(f"- source: `configs-v2/skills/{phase}.yaml`\n")
+    w(f"- default_method_ids: `{_dumps(node.get('default_method_ids') or [])}`\n")
+    w("- methods:\n")
     for method_id, method_node in (node.get("methods") or {}).items():
         enabled = method_node.get("enabled")
         steps = method_node.get("steps") or []
         allowed_tools = method_node.get("allowed_tools") or []
         gate_profile = method_node.get("gate_profile")
-        lines.append(
+        w(
             f"  - `{method_id}` enabled=`{enabled}` gate_profile=`{gate_profile}` "
-            f"steps=`{json.dumps(steps, ensure_ascii=False)}` allowed_tools=`{json.dumps(allowed_tools, ensure_ascii=False)}`"
+            f"steps=`{_dumps(steps)}` allowed_tools=`{_dumps(allowed_tools)}`\n"
         )
-    lines.append("- step_defaults:")
+    w("- step_defaults:\n")
     for step_id, step_node in (node.get("step_defaults") or {}).items():
         desc = step_node.get("description", "")
         desc_part = f" — {desc}" if desc else ""
-        lines.append(
+        w(
             f"  - `{step_id}`{desc_part} tool=`{step_node.get('default_tool')}` "
             f"mode=`{step_node.get('default_mode')}` "
-            f"web_research_mode=`{step_node.get('web_research_mode')}`"
+            f"web_research_mode=`{step_node.get('web_research_mode')}`\n"
         )
-    return "\n".join(lines)
 
 
-def _render_servant(tool: str, node: Dict[str, Any]) -> str:
-    lines: List[str] = []
-    lines.append(f"### `{tool}`")
-    lines.append(f"- source: `configs-v2/servants/{tool}.yaml`")
-    lines.append(f"- default_model: `{node.get('default_model')}`")
-    lines.append(
-        f"- allowed_models: `{json.dumps(node.get('allowed_models') or [], ensure_ascii=False)}`"
-    )
+def _render_servant(buf: TextIO, tool: str, node: Dict[str, Any]) -> None:
+    w = buf.write
+    w(f"### `{tool}`\n")
+    w(f"- source: `configs-v2/servants/{tool}.yaml`\n")
+    w(f"- default_model: `{node.get('default_model')}`\n")
+    w(f"- allowed_models: `{_dumps(node.get('allowed_models') or [])}`\n")
     wrapper_defaults = node.get("wrapper_defaults") or {}
-    lines.append(
-        f"- wrapper_defaults: `{json.dumps(wrapper_defaults, ensure_ascii=False)}`"
-    )
-    modes = (node.get("web_capabilities") or {}).get("modes") or []
-    lines.append(f"- web_modes: `{json.dumps(modes, ensure_ascii=False)}`")
-    return "\n".join(lines)
+    w(f"- wrapper_defaults: `{_dumps(wrapper_defaults)}`\n")
+    web_capabilities = node.get("web_capabilities") or {}
+    modes = web_capabilities.get("modes") or []
+    w(f"- web_modes: `{_dumps(modes)}`\n")
 
 
-def _render_policies(policies: Dict[str, Any]) -> str:
-    lines: List[str] = []
-    lines.append("## Policies")
-    lines.append("")
+def _render_policies(buf: TextIO, policies: Dict[str, Any]) -> None:
+    w = buf.write
+    w("## Policies\n\n")
 
     routing = policies["routing"]
-    lines.append("### `routing`")
-    lines.append("- source: `configs-v2/policies/routing.yaml`")
-    lines.append(
-        "- stop_policy.conditions: "
-        f"`{json.dumps((routing.get('stop_policy') or {}).get('conditions') or [], ensure_ascii=False)}`"
-    )
-    lines.append(
-        f"- stop_policy.on_stop: `{(routing.get('stop_policy') or {}).get('on_stop')}`"
-    )
-    lines.append(
-        "- confidence_policy: "
-        f"`{json.dumps(routing.get('confidence_policy') or {}, ensure_ascii=False)}`"
-    )
-    lines.append(
-        "- hard_stop_reason_map keys: "
-        f"`{json.dumps(sorted((routing.get('hard_stop_reason_map') or {}).keys()), ensure_ascii=False)}`"
-    )
-    lines.append(
+    stop_policy = routing.get("stop_policy") or {}
+    hard_stop_reasons = sorted(routing.get("hard_stop_reason_map") or {})
+    w("### `routing`\n")
+    w("- source: `configs-v2/policies/routing.yaml`\n")
+    w(f"- stop_policy.conditions: `{_dumps(stop_policy.get('conditions') or [])}`\n")
+    w(f"- stop_policy.on_stop: `{stop_policy.get('on_stop')}`\n")
+    w(f"- confidence_policy: `{_dumps(routing.get('confidence_policy') or {})}`\n")
+    w(f"- hard_stop_reason_map keys: `{_dumps(hard_stop_reasons)}`\n")
+    w(
         "- reproducibility_policy: "
-        f"`{json.dumps(routing.get('reproducibility_policy') or {}, ensure_ascii=False)}`"
+        f"`{_dumps(routing.get('reproducibility_policy') or {})}`\n"
     )
-    lines.append(
+    w(
         "- route_decider_policy: "
-        f"`{json.dumps(routing.get('route_decider_policy') or {}, ensure_ascii=False)}`"
+        f"`{_dumps(routing.get('route_decider_policy') or {})}`\n"
     )
-    lines.append("")
+    w("\n")
 
     review_parallel = policies["review_parallel"]
-    lines.append("### `review_parallel`")
-    lines.append("- source: `configs-v2/policies/review_parallel.yaml`")
-    lines.append(f"- config: `{json.dumps(review_parallel, ensure_ascii=False)}`")
-    lines.append("")
+    w("### `review_parallel`\n")
+    w("- source: `configs-v2/policies/review_parallel.yaml`\n")
+    w(f"- config: `{_dumps(review_parallel)}`\n")
+    w("\n")
 
     web_evidence = policies["web_evidence"]
-    lines.append("### `web_evidence`")
-    lines.append("- source: `configs-v2/policies/web_evidence.yaml`")
-    lines.append(f"- config: `{json.dumps(web_evidence, ensure_ascii=False)}`")
-
-    return "\n".join(lines)
-
+    w("### `web_evidence`\n")
+    w("- source: `configs-v2/policies/web_evidence.yaml`\n")
+    w(f"- config: `{_dumps(web_evidence)}`\n")
+
+
+def write_snapshot(cfg: Dict[str, Any], buf: TextIO) -> None:
+    w = buf.write
+    w(
+        "# Config V2 Snapshot\n"
+        "\n"
+        "> Auto-generated summary of the current configs-v2 state.\n"
+        "\n"
+        f"- config_root: `{cfg.get('root')}`\n"
+        f"- version: `{cfg.get('version')}`\n"
+        "\n"
+    )
 
-def render_snapshot(cfg: Dict[str, Any]) -> str:
-    lines: List[str] = []
-    lines.append("# Config V2 Snapshot")
-    lines.append("")
-    lines.append("> Auto-generated summary of the current configs-v2 state.")
-    lines.append("")
-    lines.append(f"- config_root: `{cfg.get('root')}`")
-    lines.append(f"- version: `{cfg.get('version')}`")
-    lines.append("")
-
-    lines.append("## Skills")
-    lines.append("")
+    w("## Skills\n\n")
+    skills = cfg["skills"]
     for phase in PHASES:
-        lines.append(_render_skill_phase(phase, cfg["skills"][phase]))
-        lines.append("")
+        _render_skill_phase(buf, phase, skills[phase])
+        w("\n")
 
-    lines.append("## Servants")
-    lines.append("")
+    w("## Servants\n\n")
+    servants = cfg["servants"]
     for tool in TOOLS:
-        lines.append(_render_servant(tool, cfg["servants"][tool]))
-        lines.append("")
+        _render_servant(buf, tool, servants[tool])
+        w("\n")
 
-    lines.append(_render_policies(cfg["policies"]))
-    lines.append("")
-    return "\n".join(lines)
+    _render_policies(buf, cfg["policies"])
+
+
+def render_snapshot(cfg: Dict[str, Any]) -> str:
+    buf = io.StringIO()
+    write_snapshot(cfg, buf)
+    return buf.getvalue()
 
 
 def _write_output(path: str, content: str) -> None:
-    abs_path = os.path.abspath(path)
-    directory = os.path.dirname(abs_path)
+    directory = os.path.dirname(os.path.abspath(path))
     os.makedirs(directory, exist_ok=True)
-    with open(abs_path, "w", encoding="utf-8") as f:
-        f.write(content)
+    # Written to a temp file and renamed into place, so a failed run never
+    # leaves a truncated snapshot behind.
+    fd, tmp = tempfile.mkstemp(prefix=".cfgsnapshot.", suffix=".tmp", dir=directory)
+    renamed = False
+    try:
+        try:
+            # mkstemp creates 0600; keep the mode a plain open() would give.
+            umask = os.umask(0)
+            os.umask(umask)
+            os.fchmod(fd, 0o666 & ~umask)
+            # Binary: the snapshot is UTF-8 with "\n" line endings, so the text
+            # layer's encoder and newline translation are not needed.
+            view = memoryview(content.encode("utf-8"))
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+        renamed = True
+    finally:
+        if not renamed:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
 
 
 def _main() -> int:
@@ -158,7 +172,7 @@ def _main() -> int:
     args = parser.parse_args()
 
     try:
-        cfg = load_and_validate_v2_config(args.config_root)
+        cfg = cached_load("v2-config", args.config_root, load_and_validate_v2_config)
         snapshot = render_snapshot(cfg)
     except ValidationError as e:
         print(f"CONFIG V2 SNAPSHOT ERROR: {e}", file=sys.stderr)
@@ -167,9 +181,8 @@ def _main() -> int:
     if args.output:
         _write_output(args.output, snapshot)
 
+    # write_snapshot() always ends the snapshot with a newline.
     sys.stdout.write(snapshot)
-    if not snapshot.endswith("\n"):
-        sys.stdout.write("\n")
     return 0
 
 
@@ -3,50 +3,116 @@
 
 from __future__ import annotations
 
-import argparse
-import json
+import contextlib
+import copy
+import functools
 import os
+import stat
 import sys
-from typing import Any, Dict, Iterable, Mapping, Optional, Sequence
-
-import yaml
+from types import MappingProxyType
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    IO,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from config_cache import (  # type: ignore
+    cache_enabled,
+    cached_load,
+    config_fingerprint,
+    file_fingerprint,
+    per_cfg,
+    stamp_matches,
+    write_stamp,
+)
 
 SERVANT_NAMES = ("codex", "gemini", "copilot")
 
 PIPELINE_FLAGS = {
-    "impl": {"enable_brief", "enable_verify", "enable_review"},
-    "review": {"enable_verify", "enable_review"},
-    "plan": {
-        "enable_codex_enrich",
-        "enable_gemini_enrich",
-        "enable_cross_review",
-    },
+    "impl": frozenset({"enable_brief", "enable_verify", "enable_review"}),
+    "review": frozenset({"enable_verify", "enable_review"}),
+    "plan": frozenset(
+        {
+            "enable_codex_enrich",
+            "enable_gemini_enrich",
+            "enable_cross_review",
+        }
+    ),
 }
 
 PIPELINE_OPTIONS = {
     "impl": {
-        "impl_mode": {"safe", "one_shot"},
-        "timeout_mode": {"enforce", "wait_done"},
+        "impl_mode": frozenset({"safe", "one_shot"}),
+        "timeout_mode": frozenset({"enforce", "wait_done"}),
     },
     "review": {
-        "review_mode": {"codex_only", "cross"},
-        "timeout_mode": {"enforce", "wait_done"},
+        "review_mode": frozenset({"codex_only", "cross"}),
+        "timeout_mode": frozenset({"enforce", "wait_done"}),
     },
     "plan": {
-        "consolidate_mode": {"standard"},
-        "timeout_mode": {"enforce", "wait_done"},
+        "consolidate_mode": frozenset({"standard"}),
+        "timeout_mode": frozenset({"enforce", "wait_done"}),
     },
 }
 
 WRAPPER_DEFAULT_KEYS = {
-    "codex": {"effort", "timeout_ms", "timeout_mode"},
-    "gemini": {"approval_mode", "sandbox", "timeout_ms", "timeout_mode"},
-    "copilot": {"timeout_ms", "timeout_mode"},
+    "codex": frozenset({"effort", "timeout_ms", "timeout_mode"}),
+    "gemini": frozenset({"approval_mode", "sandbox", "timeout_ms", "timeout_mode"}),
+    "copilot": frozenset({"timeout_ms", "timeout_mode"}),
 }
 
-CODEX_EFFORT_VALUES = {"low", "medium", "high", "xhigh"}
-GEMINI_APPROVAL_VALUES = {"default", "auto_edit", "yolo"}
-TIMEOUT_MODE_VALUES = {"enforce", "wait_done"}
+# Manifests may carry flags/options of any pipeline.
+_ALL_PIPELINE_FLAGS = frozenset().union(*PIPELINE_FLAGS.values())
+_ALL_PIPELINE_OPTIONS = {
+    name: values
+    for opt_map in PIPELINE_OPTIONS.values()
+    for name, values in opt_map.items()
+}
+
+_SERVANT_NAME_SET = frozenset(SERVANT_NAMES)
+_CFG_KEYS = frozenset({"version", "servants", "pipelines"})
+_SERVANT_KEYS = frozenset(
+    {
+        "default_model",
+        "allowed_models",
+        "wrapper_defaults",
+        "purpose_models",
+        "purpose_efforts",
+    }
+)
+# "full format" servant file keys: version 1 (legacy) + version 2 extension fields.
+# web_capabilities and purpose_* are each optional in the opposite schema
+# version, allowing a single servant file to satisfy both the v1 runtime
+# (config_resolve.py needs purpose_models/purpose_efforts) and the v2
+# validator (config_validate_v2.py needs web_capabilities).
+_SERVANT_FILE_KEYS = _SERVANT_KEYS | {
+    "version",
+    "tool",
+    "web_capabilities",  # v2 extension — optional, ignored by v1 runtime
+    "effort_level_descriptions",  # documentation only — optional, ignored by runtime
+}
+_PURPOSE_KEYS = frozenset({"impl", "review", "verify", "plan", "one_shot"})
+_PIPELINE_NAMES = frozenset({"impl", "review", "plan"})
+_PIPELINE_KEYS = frozenset({"default_profile", "profiles"})
+_PIPELINE_FILE_KEYS = _PIPELINE_KEYS | {"version", "pipeline"}
+_PROFILE_KEYS = frozenset(
+    {"stages", "flags", "options", "stage_models", "stage_efforts"}
+)
+_ROUTING_KEYS = frozenset({"intent", "model", "pipeline"})
+_ROUTING_PIPELINE_KEYS = frozenset({"profile", "flags", "options"})
+
+CODEX_EFFORT_VALUES = frozenset({"low", "medium", "high", "xhigh"})
+GEMINI_APPROVAL_VALUES = frozenset({"default", "auto_edit", "yolo"})
+TIMEOUT_MODE_VALUES = frozenset({"enforce", "wait_done"})
 
 PLAN_STAGE_TOOL = {
     "copilot_draft": "copilot",
@@ -70,6 +136,10 @@ PIPELINE_FILES = {
 }
 
 
+# Stand-in for absent optional sections; read-only so it can be shared.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
 class ValidationError(Exception):
     pass
 
@@ -78,11 +148,42 @@ def _die(path: str, msg: str) -> None:
     raise ValidationError(f"{path}: {msg}")
 
 
-def _load_yaml(path: str) -> Dict[str, Any]:
-    if not os.path.isfile(path):
-        _die(path, "file not found")
-    with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+@functools.lru_cache(maxsize=None)
+def _yaml() -> Any:
+    # Imported on first parse so that warm cache hits and library callers that
+    # only validate in-memory dicts do not pay for PyYAML.
+    import yaml
+
+    return yaml
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_loader() -> Any:
+    yaml = _yaml()
+    # libyaml-backed loader when PyYAML was built with it; same safe subset.
+    base = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    class _InterningLoader(base):  # type: ignore[misc, valid-type]
+        pass
+
+    # Parsed strings are fresh objects; interning them as they are constructed
+    # lets the membership and key lookups against the (interned) literals above
+    # match by identity. Doing it in the constructor also keeps aliases shared
+    # and recursive ones intact.
+    _InterningLoader.add_constructor(
+        "tag:yaml.org,2002:str",
+        lambda loader, node: sys.intern(loader.construct_scalar(node)),
+    )
+    return _InterningLoader
+
+
+def _parse_yaml(path: str) -> Any:
+    # Binary stream: the loader detects the encoding and decodes as it reads.
+    with open(path, "rb") as f:
+        return _yaml().load(f, Loader=_yaml_loader())
+
+
+def _check_document(data: Any, path: str) -> Dict[str, Any]:
     if data is None:
         _die(path, "file is empty")
     if not isinstance(data, dict):
@@ -90,358 +191,357 @@ def _load_yaml(path: str) -> Dict[str, Any]:
     return data
 
 
-def _ensure_keys(mapping: Mapping[str, Any], allowed: Iterable[str], path: str) -> None:
-    allowed_set = set(allowed)
-    unknown = sorted(set(mapping.keys()) - allowed_set)
-    if unknown:
-        _die(path, f"unknown keys: {', '.join(unknown)}")
+@functools.lru_cache(maxsize=64)
+def _parse_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    # mtime_ns/size are only part of the key so that edits miss the cache.
+    return _parse_yaml(path)
 
 
-def _expect_type(value: Any, t: type, path: str) -> None:
-    if not isinstance(value, t):
-        _die(path, f"must be {t.__name__}")
+def _load_yaml(path: str) -> Dict[str, Any]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
+        _die(path, "file not found")
+    if cache_enabled():
+        key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+        data = copy.deepcopy(_parse_yaml_cached(*key))
+    else:
+        data = _parse_yaml(path)
+    return _check_document(data, path)
+
+
+def _ensure_keys(
+    mapping: Mapping[str, Any], allowed: AbstractSet[str], path: str, suffix: str = ""
+) -> None:
+    # path + suffix is only joined on failure; the success path builds no strings.
+    unknown = mapping.keys() - allowed
+    if unknown:
+        _die(path + suffix, f"unknown keys: {', '.join(sorted(unknown))}")
 
 
-def _expect_str_set(value: Any, path: str) -> Sequence[str]:
-    _expect_type(value, list, path)
-    out = []
-    for i, item in enumerate(value):
-        if not isinstance(item, str) or not item.strip():
-            _die(f"{path}[{i}]", "must be a non-empty string")
-        out.append(item)
-    return out
+def _expect_type(value: Any, t: type, path: str, suffix: str = "") -> None:
+    if not isinstance(value, t):
+        _die(path + suffix, f"must be {t.__name__}")
+
+
+def _get_mapping(
+    parent: Mapping[str, Any], key: str, path: str, suffix: str = ""
+) -> Mapping[str, Any]:
+    """parent[key] if it is a non-empty mapping, _EMPTY if absent or empty."""
+    value = parent.get(key)
+    if not value:
+        return _EMPTY
+    if not isinstance(value, dict):
+        _die(path + suffix, "must be a mapping")
+    return value
+
+
+def _expect_str_set(value: Any, path: str, suffix: str = "") -> Sequence[str]:
+    _expect_type(value, list, path, suffix)
+    bad = next(
+        (
+            i
+            for i, item in enumerate(value)
+            if not isinstance(item, str) or not item.strip()
+        ),
+        -1,
+    )
+    if bad >= 0:
+        _die(f"{path}{suffix}[{bad}]", "must be a non-empty string")
+    return value
 
 
+@functools.lru_cache(maxsize=256)
 def _stage_to_tool(stage: str, pipeline_name: str) -> Optional[str]:
     if pipeline_name == "plan":
         return PLAN_STAGE_TOOL.get(stage)
     if "_" not in stage:
         return None
     tool = stage.split("_", 1)[0]
-    return tool if tool in SERVANT_NAMES else None
+    return tool if tool in _SERVANT_NAME_SET else None
 
 
-def validate_runtime_config_dict(
-    cfg: Dict[str, Any], cfg_path: str = "config"
-) -> Dict[str, Any]:
-    _ensure_keys(cfg, {"version", "servants", "pipelines"}, cfg_path)
+def _validate_servant(servant: str, node: Any, path: str) -> FrozenSet[str]:
+    _expect_type(node, dict, path)
+    _ensure_keys(node, _SERVANT_KEYS, path)
 
-    version = cfg.get("version")
-    if version != 1:
-        _die(f"{cfg_path}.version", "must be 1")
-
-    servants = cfg.get("servants")
-    _expect_type(servants, dict, f"{cfg_path}.servants")
-    _ensure_keys(servants, set(SERVANT_NAMES), f"{cfg_path}.servants")
-
-    for servant in SERVANT_NAMES:
-        node = servants.get(servant)
-        _expect_type(node, dict, f"{cfg_path}.servants.{servant}")
-        _ensure_keys(
-            node,
-            {
-                "default_model",
-                "allowed_models",
-                "wrapper_defaults",
-                "purpose_models",
-                "purpose_efforts",
-            },
-            f"{cfg_path}.servants.{servant}",
-        )
-
-        default_model = node.get("default_model")
-        if not isinstance(default_model, str) or not default_model.strip():
-            _die(
-                f"{cfg_path}.servants.{servant}.default_model",
-                "must be a non-empty string",
-            )
-
-        allowed_models = _expect_str_set(
-            node.get("allowed_models"), f"{cfg_path}.servants.{servant}.allowed_models"
-        )
-        if default_model not in allowed_models:
-            _die(
-                f"{cfg_path}.servants.{servant}.default_model",
-                "must be included in allowed_models",
-            )
+    default_model = node.get("default_model")
+    if not isinstance(default_model, str) or not default_model.strip():
+        _die(f"{path}.default_model", "must be a non-empty string")
 
-        wrapper_defaults = node.get("wrapper_defaults")
-        _expect_type(
-            wrapper_defaults, dict, f"{cfg_path}.servants.{servant}.wrapper_defaults"
-        )
-        _ensure_keys(
-            wrapper_defaults,
-            WRAPPER_DEFAULT_KEYS[servant],
-            f"{cfg_path}.servants.{servant}.wrapper_defaults",
-        )
-        missing_wrapper_keys = sorted(
-            WRAPPER_DEFAULT_KEYS[servant] - set(wrapper_defaults.keys())
-        )
-        if missing_wrapper_keys:
-            _die(
-                f"{cfg_path}.servants.{servant}.wrapper_defaults",
-                f"missing required keys: {', '.join(missing_wrapper_keys)}",
-            )
-        for key, raw in wrapper_defaults.items():
-            key_path = f"{cfg_path}.servants.{servant}.wrapper_defaults.{key}"
-            if key == "timeout_ms":
-                if not isinstance(raw, int) or raw < 0:
-                    _die(key_path, "must be a non-negative integer")
-            elif key == "timeout_mode":
-                if not isinstance(raw, str) or raw not in TIMEOUT_MODE_VALUES:
-                    _die(
-                        key_path,
-                        f"must be one of: {', '.join(sorted(TIMEOUT_MODE_VALUES))}",
-                    )
-            elif servant == "codex" and key == "effort":
-                if not isinstance(raw, str) or raw not in CODEX_EFFORT_VALUES:
-                    _die(
-                        key_path,
-                        f"must be one of: {', '.join(sorted(CODEX_EFFORT_VALUES))}",
-                    )
-            elif servant == "gemini" and key == "approval_mode":
-                if not isinstance(raw, str) or raw not in GEMINI_APPROVAL_VALUES:
-                    _die(
-                        key_path,
-                        f"must be one of: {', '.join(sorted(GEMINI_APPROVAL_VALUES))}",
-                    )
-            elif servant == "gemini" and key == "sandbox":
-                if not isinstance(raw, bool):
-                    _die(key_path, "must be boolean")
+    allowed_models = frozenset(
+        _expect_str_set(node.get("allowed_models"), path, ".allowed_models")
+    )
+    if default_model not in allowed_models:
+        _die(f"{path}.default_model", "must be included in allowed_models")
 
-        purpose_models = node.get("purpose_models") or {}
-        _expect_type(
-            purpose_models, dict, f"{cfg_path}.servants.{servant}.purpose_models"
-        )
-        _ensure_keys(
-            purpose_models,
-            {"impl", "review", "verify", "plan", "one_shot"},
-            f"{cfg_path}.servants.{servant}.purpose_models",
+    wrapper_defaults = node.get("wrapper_defaults")
+    _expect_type(wrapper_defaults, dict, path, ".wrapper_defaults")
+    _ensure_keys(
+        wrapper_defaults, WRAPPER_DEFAULT_KEYS[servant], path, ".wrapper_defaults"
+    )
+    missing_wrapper_keys = sorted(
+        WRAPPER_DEFAULT_KEYS[servant] - wrapper_defaults.keys()
+    )
+    if missing_wrapper_keys:
+        _die(
+            f"{path}.wrapper_defaults",
+            f"missing required keys: {', '.join(missing_wrapper_keys)}",
         )
+    for key, raw in wrapper_defaults.items():
+        if key == "timeout_ms":
+            if not isinstance(raw, int) or raw < 0:
+                _die(f"{path}.wrapper_defaults.{key}", "must be a non-negative integer")
+        elif key == "timeout_mode":
+            if not isinstance(raw, str) or raw not in TIMEOUT_MODE_VALUES:
+                _die(
+                    f"{path}.wrapper_defaults.{key}",
+                    f"must be one of: {', '.join(sorted(TIMEOUT_MODE_VALUES))}",
+                )
+        elif servant == "codex" and key == "effort":
+            if not isinstance(raw, str) or raw not in CODEX_EFFORT_VALUES:
+                _die(
+                    f"{path}.wrapper_defaults.{key}",
+                    f"must be one of: {', '.join(sorted(CODEX_EFFORT_VALUES))}",
+                )
+        elif servant == "gemini" and key == "approval_mode":
+            if not isinstance(raw, str) or raw not in GEMINI_APPROVAL_VALUES:
+                _die(
+                    f"{path}.wrapper_defaults.{key}",
+                    f"must be one of: {', '.join(sorted(GEMINI_APPROVAL_VALUES))}",
+                )
+        elif servant == "gemini" and key == "sandbox":
+            if not isinstance(raw, bool):
+                _die(f"{path}.wrapper_defaults.{key}", "must be boolean")
+
+    purpose_models = node.get("purpose_models") or _EMPTY
+    if purpose_models:
+        _expect_type(purpose_models, dict, path, ".purpose_models")
+        _ensure_keys(purpose_models, _PURPOSE_KEYS, path, ".purpose_models")
         for purpose_name, model in purpose_models.items():
             if not isinstance(model, str) or not model.strip():
                 _die(
-                    f"{cfg_path}.servants.{servant}.purpose_models.{purpose_name}",
+                    f"{path}.purpose_models.{purpose_name}",
                     "must be a non-empty string",
                 )
             if model not in allowed_models:
                 _die(
-                    f"{cfg_path}.servants.{servant}.purpose_models.{purpose_name}",
+                    f"{path}.purpose_models.{purpose_name}",
                     f"model '{model}' is not in allowed_models",
                 )
 
-        purpose_efforts = node.get("purpose_efforts") or {}
-        _expect_type(
-            purpose_efforts, dict, f"{cfg_path}.servants.{servant}.purpose_efforts"
-        )
-        if servant != "codex" and purpose_efforts:
-            _die(
-                f"{cfg_path}.servants.{servant}.purpose_efforts",
-                "is only supported for codex",
-            )
-        _ensure_keys(
-            purpose_efforts,
-            {"impl", "review", "verify", "plan", "one_shot"},
-            f"{cfg_path}.servants.{servant}.purpose_efforts",
-        )
+    purpose_efforts = node.get("purpose_efforts") or _EMPTY
+    if purpose_efforts:
+        _expect_type(purpose_efforts, dict, path, ".purpose_efforts")
+        if servant != "codex":
+            _die(f"{path}.purpose_efforts", "is only supported for codex")
+        _ensure_keys(purpose_efforts, _PURPOSE_KEYS, path, ".purpose_efforts")
         for purpose_name, effort in purpose_efforts.items():
             if not isinstance(effort, str) or effort not in CODEX_EFFORT_VALUES:
                 _die(
-                    f"{cfg_path}.servants.{servant}.purpose_efforts.{purpose_name}",
+                    f"{path}.purpose_efforts.{purpose_name}",
                     f"must be one of: {', '.join(sorted(CODEX_EFFORT_VALUES))}",
                 )
 
-    pipelines = cfg.get("pipelines")
-    _expect_type(pipelines, dict, f"{cfg_path}.pipelines")
-    _ensure_keys(pipelines, {"impl", "review", "plan"}, f"{cfg_path}.pipelines")
+    return allowed_models
 
-    for pipeline_name in ("impl", "review", "plan"):
-        pipeline = pipelines.get(pipeline_name)
-        _expect_type(pipeline, dict, f"{cfg_path}.pipelines.{pipeline_name}")
-        _ensure_keys(
-            pipeline,
-            {"default_profile", "profiles"},
-            f"{cfg_path}.pipelines.{pipeline_name}",
-        )
 
-        default_profile = pipeline.get("default_profile")
-        if not isinstance(default_profile, str) or not default_profile.strip():
-            _die(
-                f"{cfg_path}.pipelines.{pipeline_name}.default_profile",
-                "must be a non-empty string",
-            )
+def _validate_pipeline_head(pipeline: Any, path: str) -> Dict[str, Any]:
+    _expect_type(pipeline, dict, path)
+    _ensure_keys(pipeline, _PIPELINE_KEYS, path)
 
-        profiles = pipeline.get("profiles")
-        _expect_type(profiles, dict, f"{cfg_path}.pipelines.{pipeline_name}.profiles")
-        if not profiles:
-            _die(
-                f"{cfg_path}.pipelines.{pipeline_name}.profiles",
-                "must define at least one profile",
-            )
-        if default_profile not in profiles:
-            _die(
-                f"{cfg_path}.pipelines.{pipeline_name}.default_profile",
-                "must match a profile name",
-            )
+    default_profile = pipeline.get("default_profile")
+    if not isinstance(default_profile, str) or not default_profile.strip():
+        _die(f"{path}.default_profile", "must be a non-empty string")
 
-        for profile_name, profile in profiles.items():
-            _expect_type(
-                profile,
-                dict,
-                f"{cfg_path}.pipelines.{pipeline_name}.profiles.{profile_name}",
-            )
-            _ensure_keys(
-                profile,
-                {"stages", "flags", "options", "stage_models", "stage_efforts"},
-                f"{cfg_path}.pipelines.{pipeline_name}.profiles.{profile_name}",
-            )
+    profiles = pipeline.get("profiles")
+    _expect_type(profiles, dict, path, ".profiles")
+    if not profiles:
+        _die(f"{path}.profiles", "must define at least one profile")
+    if default_profile not in profiles:
+        _die(f"{path}.default_profile", "must match a profile name")
+    return profiles
 
-            if pipeline_name in {"impl", "review"}:
-                stages = _expect_str_set(
-                    profile.get("stages"),
-                    f"{cfg_path}.pipelines.{pipeline_name}.profiles.{profile_name}.stages",
-                )
-                if not stages:
-                    _die(
-                        f"{cfg_path}.pipelines.{pipeline_name}.profiles.{profile_name}.stages",
-                        "must not be empty",
-                    )
-                for idx, stage in enumerate(stages):
-                    tool = _stage_to_tool(stage, pipeline_name)
-                    if tool is None:
-                        _die(
-                            f"{cfg_path}.pipelines.{pipeline_name}.profiles.{profile_name}.stages[{idx}]",
-                            "must start with a known tool prefix",
-                        )
-            elif "stages" in profile and profile.get("stages") not in (None, []):
-                _die(
-                    f"{cfg_path}.pipelines.{pipeline_name}.profiles.{profile_name}.stages",
-                    "is not supported for the plan pipeline",
-                )
 
-            flags = profile.get("flags") or {}
-            _expect_type(
-                flags,
-                dict,
-                f"{cfg_path}.pipelines.{pipeline_name}.profiles.{profile_name}.flags",
-            )
-            _ensure_keys(
-                flags,
-                PIPELINE_FLAGS[pipeline_name],
-                f"{cfg_path}.pipelines.{pipeline_name}.profiles.{profile_name}.flags",
-            )
+_ProfileValidator = Callable[[Any, str, Mapping[str, FrozenSet[str]]], None]
+
+
+def _make_profile_validator(
+    pipeline_name: str,
+    allowed_flags: FrozenSet[str],
+    allowed_options: Mapping[str, FrozenSet[str]],
+    requires_stages: bool,
+) -> _ProfileValidator:
+    """Return a profile checker with this pipeline's rules bound as closure cells."""
+    option_names = allowed_options.keys()
+
+    def validate(
+        profile: Any, path: str, allowed_by_tool: Mapping[str, FrozenSet[str]]
+    ) -> None:
+        _expect_type(profile, dict, path)
+        _ensure_keys(profile, _PROFILE_KEYS, path)
+
+        if requires_stages:
+            stages = _expect_str_set(profile.get("stages"), path, ".stages")
+            if not stages:
+                _die(f"{path}.stages", "must not be empty")
+            for idx, stage in enumerate(stages):
+                tool = _stage_to_tool(stage, pipeline_name)
+                if tool is None:
+                    _die(f"{path}.stages[{idx}]", "must start with a known tool prefix")
+        elif profile.get("stages") not in (None, []):
+            _die(f"{path}.stages", "is not supported for the plan pipeline")
+
+        flags = profile.get("flags") or _EMPTY
+        if flags:
+            _expect_type(flags, dict, path, ".flags")
+            _ensure_keys(flags, allowed_flags, path, ".flags")
             for flag_name, flag_value in flags.items():
                 if not isinstance(flag_value, bool):
-                    _die(
-                        f"{cfg_path}.pipelines.{pipeline_name}.profiles.{profile_name}.flags.{flag_name}",
-                        "must be boolean",
-                    )
+                    _die(f"{path}.flags.{flag_name}", "must be boolean")
 
-            options = profile.get("options") or {}
-            _expect_type(
-                options,
-                dict,
-                f"{cfg_path}.pipelines.{pipeline_name}.profiles.{profile_name}.options",
-            )
-            _ensure_keys(
-                options,
-                PIPELINE_OPTIONS[pipeline_name].keys(),
-                f"{cfg_path}.pipelines.{pipeline_name}.profiles.{profile_name}.options",
-            )
+        options = profile.get("options") or _EMPTY
+        if options:
+            _expect_type(options, dict, path, ".options")
+            _ensure_keys(options, option_names, path, ".options")
             for opt_name, opt_val in options.items():
                 if not isinstance(opt_val, str):
-                    _die(
-                        f"{cfg_path}.pipelines.{pipeline_name}.profiles.{profile_name}.options.{opt_name}",
-                        "must be string",
-                    )
-                allowed_vals = PIPELINE_OPTIONS[pipeline_name][opt_name]
+                    _die(f"{path}.options.{opt_name}", "must be string")
+                allowed_vals = allowed_options[opt_name]
                 if opt_val not in allowed_vals:
                     _die(
-                        f"{cfg_path}.pipelines.{pipeline_name}.profiles.{profile_name}.options.{opt_name}",
+                        f"{path}.options.{opt_name}",
                         f"must be one of: {', '.join(sorted(allowed_vals))}",
                     )
 
-            stage_models = profile.get("stage_models") or {}
-            _expect_type(
-                stage_models,
-                dict,
-                f"{cfg_path}.pipelines.{pipeline_name}.profiles.{profile_name}.stage_models",
-            )
+        stage_models = profile.get("stage_models") or _EMPTY
+        if stage_models:
+            _expect_type(stage_models, dict, path, ".stage_models")
             for stage_name, model in stage_models.items():
                 if not isinstance(model, str) or not model.strip():
                     _die(
-                        f"{cfg_path}.pipelines.{pipeline_name}.profiles.{profile_name}.stage_models.{stage_name}",
+                        f"{path}.stage_models.{stage_name}",
                         "must be a non-empty string",
                     )
                 tool = _stage_to_tool(stage_name, pipeline_name)
                 if tool is None:
+                    _die(f"{path}.stage_models.{stage_name}", "unknown stage name")
+                allowed = allowed_by_tool.get(tool)
+                # None: the servant itself failed validation and was reported.
+                if allowed is not None and model not in allowed:
                     _die(
-                        f"{cfg_path}.pipelines.{pipeline_name}.profiles.{profile_name}.stage_models.{stage_name}",
-                        "unknown stage name",
-                    )
-                allowed = servants[tool]["allowed_models"]
-                if model not in allowed:
-                    _die(
-                        f"{cfg_path}.pipelines.{pipeline_name}.profiles.{profile_name}.stage_models.{stage_name}",
+                        f"{path}.stage_models.{stage_name}",
                         f"model '{model}' is not allowed for servant '{tool}'",
                     )
 
-            stage_efforts = profile.get("stage_efforts") or {}
-            _expect_type(
-                stage_efforts,
-                dict,
-                f"{cfg_path}.pipelines.{pipeline_name}.profiles.{profile_name}.stage_efforts",
-            )
+        stage_efforts = profile.get("stage_efforts") or _EMPTY
+        if stage_efforts:
+            _expect_type(stage_efforts, dict, path, ".stage_efforts")
             for stage_name, effort in stage_efforts.items():
                 if not isinstance(effort, str) or effort not in CODEX_EFFORT_VALUES:
                     _die(
-                        f"{cfg_path}.pipelines.{pipeline_name}.profiles.{profile_name}.stage_efforts.{stage_name}",
+                        f"{path}.stage_efforts.{stage_name}",
                         f"must be one of: {', '.join(sorted(CODEX_EFFORT_VALUES))}",
                     )
                 tool = _stage_to_tool(stage_name, pipeline_name)
                 if tool is None:
-                    _die(
-                        f"{cfg_path}.pipelines.{pipeline_name}.profiles.{profile_name}.stage_efforts.{stage_name}",
-                        "unknown stage name",
-                    )
+                    _die(f"{path}.stage_efforts.{stage_name}", "unknown stage name")
                 if tool != "codex":
                     _die(
-                        f"{cfg_path}.pipelines.{pipeline_name}.profiles.{profile_name}.stage_efforts.{stage_name}",
+                        f"{path}.stage_efforts.{stage_name}",
                         "is only supported for codex stages",
                     )
 
+    return validate
+
+
+_PROFILE_VALIDATORS: Dict[str, _ProfileValidator] = {
+    name: _make_profile_validator(
+        name, PIPELINE_FLAGS[name], PIPELINE_OPTIONS[name], name != "plan"
+    )
+    for name in ("impl", "review", "plan")
+}
+
+
+class _ErrorCollector:
+    """Collects ValidationErrors from independent sections; strict re-raises."""
+
+    def __init__(self, strict: bool) -> None:
+        self.strict = strict
+        self.messages: List[str] = []
+
+    @contextlib.contextmanager
+    def section(self) -> Iterator[None]:
+        try:
+            yield
+        except ValidationError as e:
+            if self.strict:
+                raise
+            self.messages.append(str(e))
+
+    def raise_if_any(self) -> None:
+        if self.messages:
+            raise ValidationError("\n".join(self.messages))
+
+
+def validate_runtime_config_dict(
+    cfg: Dict[str, Any], cfg_path: str = "config", strict: bool = False
+) -> Dict[str, Any]:
+    """Validate cfg, reporting one error per failing servant, pipeline and profile.
+
+    With strict=True the first error is raised as soon as it is found.
+    """
+    _ensure_keys(cfg, _CFG_KEYS, cfg_path)
+
+    version = cfg.get("version")
+    if version != 1:
+        _die(f"{cfg_path}.version", "must be 1")
+
+    servants = cfg.get("servants")
+    _expect_type(servants, dict, cfg_path, ".servants")
+    _ensure_keys(servants, _SERVANT_NAME_SET, cfg_path, ".servants")
+
+    errors = _ErrorCollector(strict)
+    allowed_by_tool: Dict[str, FrozenSet[str]] = {}
+    for servant in SERVANT_NAMES:
+        with errors.section():
+            allowed_by_tool[servant] = _validate_servant(
+                servant, servants.get(servant), f"{cfg_path}.servants.{servant}"
+            )
+
+    pipelines = cfg.get("pipelines")
+    with errors.section():
+        _expect_type(pipelines, dict, cfg_path, ".pipelines")
+        _ensure_keys(pipelines, _PIPELINE_NAMES, cfg_path, ".pipelines")
+    if not isinstance(pipelines, dict):
+        errors.raise_if_any()
+
+    for pipeline_name, validate_profile in _PROFILE_VALIDATORS.items():
+        pipeline_path = f"{cfg_path}.pipelines.{pipeline_name}"
+        profiles = None
+        with errors.section():
+            profiles = _validate_pipeline_head(
+                pipelines.get(pipeline_name), pipeline_path
+            )
+        if profiles is None:
+            continue
+        for profile_name, profile in profiles.items():
+            with errors.section():
+                validate_profile(
+                    profile, f"{pipeline_path}.profiles.{profile_name}", allowed_by_tool
+                )
+
+    errors.raise_if_any()
     return cfg
 
 
 def _normalize_servant_file(
     raw: Dict[str, Any], servant: str, path: str
 ) -> Dict[str, Any]:
-    # "full format" keys: version 1 (legacy) + version 2 extension fields.
-    # web_capabilities and purpose_* are each optional in the opposite schema
-    # version, allowing a single servant file to satisfy both the v1 runtime
-    # (config_resolve.py needs purpose_models/purpose_efforts) and the v2
-    # validator (config_validate_v2.py needs web_capabilities).
-    full_keys = {
-        "version",
-        "tool",
-        "default_model",
-        "allowed_models",
-        "wrapper_defaults",
-        "purpose_models",
-        "purpose_efforts",
-        "web_capabilities",  # v2 extension — optional, ignored by v1 runtime
-        "effort_level_descriptions",  # documentation only — optional, ignored by runtime
-    }
-    compact_keys = {
-        "default_model",
-        "allowed_models",
-        "wrapper_defaults",
-        "purpose_models",
-        "purpose_efforts",
-    }
-
     if "version" in raw or "tool" in raw:
-        _ensure_keys(raw, full_keys, path)
+        _ensure_keys(raw, _SERVANT_FILE_KEYS, path)
         version = raw.get("version")
         if version not in (1, 2):
             _die(f"{path}.version", "must be 1 or 2")
@@ -455,18 +555,15 @@ def _normalize_servant_file(
             "purpose_efforts": raw.get("purpose_efforts", {}),
         }
 
-    _ensure_keys(raw, compact_keys, path)
+    _ensure_keys(raw, _SERVANT_KEYS, path)
     return dict(raw)
 
 
 def _normalize_pipeline_file(
     raw: Dict[str, Any], pipeline: str, path: str
 ) -> Dict[str, Any]:
-    full_keys = {"version", "pipeline", "default_profile", "profiles"}
-    compact_keys = {"default_profile", "profiles"}
-
     if "version" in raw or "pipeline" in raw:
-        _ensure_keys(raw, full_keys, path)
+        _ensure_keys(raw, _PIPELINE_FILE_KEYS, path)
         if raw.get("version") != 1:
             _die(f"{path}.version", "must be 1")
         if raw.get("pipeline") != pipeline:
@@ -476,7 +573,7 @@ def _normalize_pipeline_file(
             "profiles": raw["profiles"],
         }
 
-    _ensure_keys(raw, compact_keys, path)
+    _ensure_keys(raw, _PIPELINE_KEYS, path)
     return dict(raw)
 
 
@@ -492,28 +589,34 @@ def _servant_subdir(root: str) -> str:
     return "servant"
 
 
-def load_and_validate_split_config(config_root: str) -> Dict[str, Any]:
+def load_and_validate_split_config(
+    config_root: str, strict: bool = False
+) -> Dict[str, Any]:
     root = os.path.abspath(config_root)
     servant_subdir = _servant_subdir(root)
     servants: Dict[str, Any] = {}
     pipelines: Dict[str, Any] = {}
+    errors = _ErrorCollector(strict)
 
     for servant, (_, filename) in SERVANT_FILES.items():
         path = os.path.join(root, servant_subdir, filename)
-        raw = _load_yaml(path)
-        servants[servant] = _normalize_servant_file(raw, servant, path)
+        with errors.section():
+            raw = _load_yaml(path)
+            servants[servant] = _normalize_servant_file(raw, servant, path)
 
     for pipeline, (subdir, filename) in PIPELINE_FILES.items():
         path = os.path.join(root, subdir, filename)
-        raw = _load_yaml(path)
-        pipelines[pipeline] = _normalize_pipeline_file(raw, pipeline, path)
+        with errors.section():
+            raw = _load_yaml(path)
+            pipelines[pipeline] = _normalize_pipeline_file(raw, pipeline, path)
 
+    errors.raise_if_any()
     cfg = {
         "version": 1,
         "servants": servants,
         "pipelines": pipelines,
     }
-    return validate_runtime_config_dict(cfg, cfg_path=root)
+    return validate_runtime_config_dict(cfg, cfg_path=root, strict=strict)
 
 
 def _pipeline_name_for_intent(cfg: Dict[str, Any], intent: str) -> Optional[str]:
@@ -524,6 +627,13 @@ def _pipeline_name_for_intent(cfg: Dict[str, Any], intent: str) -> Optional[str]
     return None
 
 
+@per_cfg
+def allowed_model_sets(cfg: Dict[str, Any]) -> Dict[str, FrozenSet[str]]:
+    """allowed_models per servant as frozensets; memoized per cfg."""
+    servants = cfg["servants"]
+    return {tool: frozenset(servants[tool]["allowed_models"]) for tool in SERVANT_NAMES}
+
+
 def validate_manifest_extensions(
     cfg: Dict[str, Any],
     manifest: Optional[Dict[str, Any]],
@@ -534,41 +644,32 @@ def validate_manifest_extensions(
     if not isinstance(manifest, dict):
         _die(manifest_path, "top-level must be a mapping")
 
-    routing = manifest.get("routing") or {}
-    if routing and not isinstance(routing, dict):
-        _die(f"{manifest_path}.routing", "must be a mapping")
+    routing = _get_mapping(manifest, "routing", manifest_path, ".routing")
     if routing:
-        _ensure_keys(
-            routing, {"intent", "model", "pipeline"}, f"{manifest_path}.routing"
-        )
+        _ensure_keys(routing, _ROUTING_KEYS, manifest_path, ".routing")
 
     if "intent" in routing and not isinstance(routing["intent"], str):
         _die(f"{manifest_path}.routing.intent", "must be a string")
 
-    model_map = routing.get("model") or {}
+    model_map = _get_mapping(routing, "model", manifest_path, ".routing.model")
     if model_map:
-        _expect_type(model_map, dict, f"{manifest_path}.routing.model")
-        _ensure_keys(model_map, set(SERVANT_NAMES), f"{manifest_path}.routing.model")
+        _ensure_keys(model_map, _SERVANT_NAME_SET, manifest_path, ".routing.model")
         for servant, model in model_map.items():
             if not isinstance(model, str) or not model.strip():
                 _die(
                     f"{manifest_path}.routing.model.{servant}",
                     "must be a non-empty string",
                 )
-            allowed = cfg["servants"][servant]["allowed_models"]
-            if model not in allowed:
+            if model not in allowed_model_sets(cfg)[servant]:
                 _die(
                     f"{manifest_path}.routing.model.{servant}",
                     f"model '{model}' is not in allowed_models",
                 )
 
-    pipeline = routing.get("pipeline") or {}
+    pipeline = _get_mapping(routing, "pipeline", manifest_path, ".routing.pipeline")
     if pipeline:
-        _expect_type(pipeline, dict, f"{manifest_path}.routing.pipeline")
         _ensure_keys(
-            pipeline,
-            {"profile", "flags", "options"},
-            f"{manifest_path}.routing.pipeline",
+            pipeline, _ROUTING_PIPELINE_KEYS, manifest_path, ".routing.pipeline"
         )
 
         profile = pipeline.get("profile")
@@ -579,37 +680,41 @@ def validate_manifest_extensions(
                     "must be a non-empty string",
                 )
 
-        flags = pipeline.get("flags") or {}
-        _expect_type(flags, dict, f"{manifest_path}.routing.pipeline.flags")
-        all_flags = set().union(*PIPELINE_FLAGS.values())
-        _ensure_keys(flags, all_flags, f"{manifest_path}.routing.pipeline.flags")
-        for flag_name, flag_val in flags.items():
-            if not isinstance(flag_val, bool):
-                _die(
-                    f"{manifest_path}.routing.pipeline.flags.{flag_name}",
-                    "must be boolean",
-                )
-
-        options = pipeline.get("options") or {}
-        _expect_type(options, dict, f"{manifest_path}.routing.pipeline.options")
+        flags = _get_mapping(
+            pipeline, "flags", manifest_path, ".routing.pipeline.flags"
+        )
+        if flags:
+            _ensure_keys(
+                flags, _ALL_PIPELINE_FLAGS, manifest_path, ".routing.pipeline.flags"
+            )
+            for flag_name, flag_val in flags.items():
+                if not isinstance(flag_val, bool):
+                    _die(
+                        f"{manifest_path}.routing.pipeline.flags.{flag_name}",
+                        "must be boolean",
+                    )
 
-        allowed_options = {}
-        for opt_map in PIPELINE_OPTIONS.values():
-            allowed_options.update(opt_map)
-        _ensure_keys(
-            options, allowed_options.keys(), f"{manifest_path}.routing.pipeline.options"
+        options = _get_mapping(
+            pipeline, "options", manifest_path, ".routing.pipeline.options"
         )
-        for opt_name, opt_val in options.items():
-            if not isinstance(opt_val, str):
-                _die(
-                    f"{manifest_path}.routing.pipeline.options.{opt_name}",
-                    "must be string",
-                )
-            if opt_val not in allowed_options[opt_name]:
-                _die(
-                    f"{manifest_path}.routing.pipeline.options.{opt_name}",
-                    f"must be one of: {', '.join(sorted(allowed_options[opt_name]))}",
-                )
+        if options:
+            _ensure_keys(
+                options,
+                _ALL_PIPELINE_OPTIONS.keys(),
+                manifest_path,
+                ".routing.pipeline.options",
+            )
+            for opt_name, opt_val in options.items():
+                if not isinstance(opt_val, str):
+                    _die(
+                        f"{manifest_path}.routing.pipeline.options.{opt_name}",
+                        "must be string",
+                    )
+                if opt_val not in _ALL_PIPELINE_OPTIONS[opt_name]:
+                    _die(
+                        f"{manifest_path}.routing.pipeline.options.{opt_name}",
+                        f"must be one of: {', '.join(sorted(_ALL_PIPELINE_OPTIONS[opt_name]))}",
+                    )
 
         intent = routing.get("intent")
         if isinstance(intent, str):
@@ -632,35 +737,77 @@ def load_manifest_if_present(path: Optional[str]) -> Optional[Dict[str, Any]]:
     return _load_yaml(path)
 
 
+def load_manifest_stream(
+    stream: IO[Any], manifest_path: str = "manifest"
+) -> Dict[str, Any]:
+    """Parse a manifest from an open text or binary stream without a temp file."""
+    data = _yaml().load(stream, Loader=_yaml_loader())
+    return _check_document(data, manifest_path)
+
+
+# The enum half of the choices catalog depends only on module constants.
+_CHOICE_ENUMS: Dict[str, Any] = {
+    "codex_effort": sorted(CODEX_EFFORT_VALUES),
+    "gemini_approval_mode": sorted(GEMINI_APPROVAL_VALUES),
+    "timeout_mode": sorted(TIMEOUT_MODE_VALUES),
+    "pipeline_options": {
+        pipeline: {opt: sorted(values) for opt, values in opt_map.items()}
+        for pipeline, opt_map in PIPELINE_OPTIONS.items()
+    },
+    "pipeline_flags": {
+        pipeline: sorted(flags) for pipeline, flags in PIPELINE_FLAGS.items()
+    },
+}
+_WRAPPER_ALLOWED_KEYS = {
+    tool: sorted(keys) for tool, keys in WRAPPER_DEFAULT_KEYS.items()
+}
+
+
+@per_cfg
 def build_choices_catalog(cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """Allowed enums/models for cfg; memoized per cfg, treat as read-only."""
+    servants = cfg["servants"]
     return {
-        "enums": {
-            "codex_effort": sorted(CODEX_EFFORT_VALUES),
-            "gemini_approval_mode": sorted(GEMINI_APPROVAL_VALUES),
-            "timeout_mode": sorted(TIMEOUT_MODE_VALUES),
-            "pipeline_options": {
-                pipeline: {opt: sorted(values) for opt, values in opt_map.items()}
-                for pipeline, opt_map in PIPELINE_OPTIONS.items()
-            },
-            "pipeline_flags": {
-                pipeline: sorted(flags) for pipeline, flags in PIPELINE_FLAGS.items()
-            },
-        },
+        "enums": _CHOICE_ENUMS,
         "servants": {
             tool: {
-                "default_model": cfg["servants"][tool]["default_model"],
-                "allowed_models": list(cfg["servants"][tool]["allowed_models"]),
+                "default_model": servants[tool]["default_model"],
+                "allowed_models": list(servants[tool]["allowed_models"]),
                 "wrapper_defaults": dict(
-                    cfg["servants"][tool].get("wrapper_defaults") or {}
+                    servants[tool].get("wrapper_defaults") or _EMPTY
                 ),
-                "wrapper_allowed_keys": sorted(WRAPPER_DEFAULT_KEYS[tool]),
+                "wrapper_allowed_keys": _WRAPPER_ALLOWED_KEYS[tool],
             }
             for tool in SERVANT_NAMES
         },
     }
 
 
+def _manifest_stamp(
+    config_root: str, manifest_path: Optional[str]
+) -> Optional[Tuple[str, str]]:
+    """(source, fingerprint) of a manifest checked against config_root.
+
+    None when there is no manifest, caching is off, or a file cannot be
+    stat'ed; the manifest is then validated as usual.
+    """
+    if not manifest_path or not cache_enabled():
+        return None
+    root = os.path.abspath(config_root)
+    source = os.path.abspath(manifest_path)
+    try:
+        cfg_fp = config_fingerprint(root, load_and_validate_split_config)
+        manifest_fp = file_fingerprint(source, load_manifest_if_present)
+    except OSError:
+        return None
+    return f"{root}\0{source}", f"{cfg_fp}/{manifest_fp}"
+
+
 def _main() -> int:
+    import argparse
+
+    from json_io import write_json_stdout  # type: ignore
+
     parser = argparse.ArgumentParser(
         description="Validate split config and optional manifest extensions"
     )
@@ -678,21 +825,28 @@ def _main() -> int:
     args = parser.parse_args()
 
     try:
-        cfg = load_and_validate_split_config(args.config_root)
-        manifest = load_manifest_if_present(args.manifest)
-        validate_manifest_extensions(
-            cfg, manifest, manifest_path=args.manifest or "manifest"
+        cfg = cached_load(
+            "split-config", args.config_root, load_and_validate_split_config
         )
+        stamp = _manifest_stamp(args.config_root, args.manifest)
+        if stamp is None or not stamp_matches("manifest-ok", *stamp):
+            manifest = load_manifest_if_present(args.manifest)
+            validate_manifest_extensions(
+                cfg, manifest, manifest_path=args.manifest or "manifest"
+            )
+            if stamp is not None:
+                write_stamp("manifest-ok", *stamp)
     except ValidationError as e:
-        print(f"CONFIG VALIDATION ERROR: {e}", file=sys.stderr)
+        for message in str(e).splitlines():
+            print(f"CONFIG VALIDATION ERROR: {message}", file=sys.stderr)
         return 1
-    except yaml.YAMLError as e:
+    # Only evaluated when something was raised, so a cache hit never imports yaml.
+    except _yaml().YAMLError as e:
         print(f"CONFIG VALIDATION ERROR: YAML parse failed: {e}", file=sys.stderr)
         return 1
 
     if args.print_choices:
-        json.dump(build_choices_catalog(cfg), sys.stdout, indent=2, sort_keys=True)
-        print("")
+        write_json_stdout(build_choices_catalog(cfg))
         return 0
 
     print("OK")
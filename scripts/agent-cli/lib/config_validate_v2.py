@@ -4,13 +4,47 @@
 from __future__ import annotations
 
 import argparse
+import copy
+import functools
 import json
 import os
+import stat
 import sys
-from typing import Any, Dict, Iterable, Mapping, Optional, Sequence, Set
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 import yaml
 
+from config_cache import cache_enabled, cached_load  # type: ignore
+from json_io import dumps_compact_bytes  # type: ignore
+
+_YAML_BASE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class _YamlLoader(_YAML_BASE_LOADER):  # type: ignore[misc, valid-type]
+    """libyaml-backed safe loader (when available) that interns string scalars.
+
+    Keys, tool names and modes repeat across files; interned copies compare by
+    identity against the module constants. Interning at construction time keeps
+    aliased (even self-referencing) nodes shared instead of rebuilding them.
+    """
+
+
+_YamlLoader.add_constructor(
+    "tag:yaml.org,2002:str",
+    lambda loader, node: sys.intern(loader.construct_scalar(node)),
+)
+
 TOOLS = ("codex", "gemini", "copilot")
 PHASES = ("plan", "impl", "review")
 WEB_RESEARCH_MODES = ("off", "codex_explicit", "gemini_auto", "copilot_mcp")
@@ -52,11 +86,145 @@ WEB_EVIDENCE_REQUIRED_FIELDS = {
     "accessed_at",
     "claim_summary",
 }
-WEB_EVIDENCE_REASON_CODES = {
-    "WEB_EVIDENCE_MISSING",
-    "WEB_EVIDENCE_UNVERIFIABLE",
-    "WEB_EVIDENCE_STALE",
+WEB_EVIDENCE_REASON_CODES = frozenset(
+    {
+        "WEB_EVIDENCE_MISSING",
+        "WEB_EVIDENCE_UNVERIFIABLE",
+        "WEB_EVIDENCE_STALE",
+    }
+)
+
+
+def _one_of(values: Iterable[str]) -> str:
+    return f"must be one of: {', '.join(values)}"
+
+
+# Error messages for the enum checks, formatted once.
+_ONE_OF_TOOLS = _one_of(TOOLS)
+_ONE_OF_DEFAULT_MODES = _one_of(DEFAULT_MODES)
+_ONE_OF_WEB_RESEARCH_MODES = _one_of(WEB_RESEARCH_MODES)
+_ONE_OF_GATE_PROFILES = _one_of(GATE_PROFILES)
+_ONE_OF_TIMEOUT_MODES = _one_of(TIMEOUT_MODES)
+_ONE_OF_TOOL_WEB_MODES = {
+    tool: _one_of(sorted(modes)) for tool, modes in TOOL_WEB_MODE_MAP.items()
 }
+_ONE_OF_STOP_ACTIONS = _one_of(sorted(ROUTING_STOP_ACTIONS))
+_ONE_OF_ON_STOP = _one_of(sorted(ROUTING_STOP_ON_STOP))
+_ONE_OF_IMPACT_SURFACES = _one_of(sorted(ROUTING_IMPACT_SURFACES))
+_ONE_OF_CONFIDENCE_VALUES = _one_of(sorted(ROUTING_CONFIDENCE_VALUES))
+_SUBSET_OF_CONFIDENCE_VALUES = (
+    f"must be subset of: {', '.join(sorted(ROUTING_CONFIDENCE_VALUES))}"
+)
+_ONE_OF_ON_MISMATCH = _one_of(sorted(REPRODUCIBILITY_ON_MISMATCH))
+_ONE_OF_STRICTNESS = _one_of(sorted(WEB_EVIDENCE_STRICTNESS))
+_ONE_OF_GATE_ACTIONS = _one_of(sorted(WEB_EVIDENCE_GATE_ACTIONS))
+
+# Membership views of the ordered enums above (the tuples keep message order).
+_TOOL_SET = frozenset(TOOLS)
+_PHASE_SET = frozenset(PHASES)
+_DEFAULT_MODE_SET = frozenset(DEFAULT_MODES)
+_WEB_RESEARCH_MODE_SET = frozenset(WEB_RESEARCH_MODES)
+_GATE_PROFILE_SET = frozenset(GATE_PROFILES)
+_TIMEOUT_MODE_SET = frozenset(TIMEOUT_MODES)
+
+# Allowed keys per node kind, built once instead of on every _ensure_keys call.
+_SKILL_KEYS = frozenset(
+    {"version", "skill", "default_method_ids", "methods", "step_defaults"}
+)
+_METHOD_KEYS = frozenset({"enabled", "steps", "allowed_tools", "gate_profile"})
+_STEP_DEFAULT_KEYS = frozenset(
+    {"default_tool", "default_mode", "web_research_mode", "description"}
+)
+# Allow v1 runtime fields (purpose_models, purpose_efforts) as optional
+# extensions so that a single servant file can satisfy both the v1 runtime
+# (config_resolve.py reads purpose_models/purpose_efforts) and this v2
+# validator. See config_validate.py::_normalize_servant_file for the mirror.
+_SERVANT_KEYS = frozenset(
+    {
+        "version",
+        "tool",
+        "default_model",
+        "allowed_models",
+        "wrapper_defaults",
+        "web_capabilities",
+        "purpose_models",  # v1 runtime extension — optional
+        "purpose_efforts",  # v1 runtime extension — optional
+        "effort_level_descriptions",  # documentation only — optional
+    }
+)
+# Allow v1 tool-specific keys (effort, approval_mode, sandbox) as optional
+# extensions so that a single servant file satisfies both validators.
+_WRAPPER_DEFAULTS_KEYS = frozenset(
+    {"timeout_ms", "timeout_mode", "effort", "approval_mode", "sandbox"}
+)
+_WEB_CAPABILITIES_KEYS = frozenset({"modes"})
+_ROUTING_KEYS = frozenset(
+    {
+        "version",
+        "stop_policy",
+        "confidence_policy",
+        "hard_stop_reason_map",
+        "reproducibility_policy",
+        "route_decider_policy",
+    }
+)
+_STOP_POLICY_KEYS = frozenset({"conditions", "on_stop"})
+_STOP_CONDITION_KEYS = frozenset(
+    {
+        "impact_surface",
+        "confidence",
+        "reason_codes_contain",
+        "strict_evidence_violation",
+        "action",
+    }
+)
+_CONFIDENCE_POLICY_KEYS = frozenset({"values", "default"})
+_REPRODUCIBILITY_KEYS = frozenset({"deterministic_required", "on_mismatch"})
+_ROUTE_DECIDER_KEYS = frozenset({"phase_prompt_paths", "schema_version"})
+_REVIEW_PARALLEL_KEYS = frozenset(
+    {
+        "version",
+        "mode",
+        "join_barrier",
+        "apply_order",
+        "worker_output_mode",
+        "merge_required",
+        "artifacts",
+    }
+)
+# (key, only accepted value) pairs of the review_parallel policy.
+_REVIEW_PARALLEL_FIXED = (
+    ("mode", REVIEW_PARALLEL_MODE),
+    ("join_barrier", REVIEW_PARALLEL_JOIN_BARRIER),
+    ("apply_order", REVIEW_PARALLEL_APPLY_ORDER),
+    ("worker_output_mode", REVIEW_PARALLEL_WORKER_OUTPUT_MODE),
+)
+_ARTIFACT_KEYS = frozenset({"findings_dir", "merged", "queue"})
+_WEB_EVIDENCE_KEYS = frozenset(
+    {
+        "version",
+        "strictness",
+        "required_fields",
+        "reason_code_map",
+        "gate_action_on_violation",
+    }
+)
+_CONFIG_V2_KEYS = frozenset({"phase_overrides"})
+_PHASE_OVERRIDE_KEYS = frozenset({"method_id", "tool_models", "step_overrides"})
+_STEP_OVERRIDE_KEYS = frozenset({"tool", "model", "default_mode", "web_research_mode"})
+
+# (key, allowed values, error message) of the enum fields of a step default and
+# of a manifest step override, in check order.
+_STEP_DEFAULT_FIELDS = (
+    ("default_tool", _TOOL_SET, _ONE_OF_TOOLS),
+    ("default_mode", _DEFAULT_MODE_SET, _ONE_OF_DEFAULT_MODES),
+    ("web_research_mode", _WEB_RESEARCH_MODE_SET, _ONE_OF_WEB_RESEARCH_MODES),
+)
+_STEP_OVERRIDE_FIELDS = (
+    ("tool", _TOOL_SET, _ONE_OF_TOOLS),
+    ("default_mode", _DEFAULT_MODE_SET, _ONE_OF_DEFAULT_MODES),
+    ("web_research_mode", _WEB_RESEARCH_MODE_SET, _ONE_OF_WEB_RESEARCH_MODES),
+)
 
 
 class ValidationError(Exception):
@@ -67,16 +235,18 @@ def _die(path: str, msg: str) -> None:
     raise ValidationError(f"{path}: {msg}")
 
 
-def _expect_type(value: Any, expected_type: type, path: str) -> None:
+def _expect_type(value: Any, expected_type: type, path: str, suffix: str = "") -> None:
+    # path + suffix is only joined on failure, so callers pass constant suffixes.
     if not isinstance(value, expected_type):
-        _die(path, f"must be {expected_type.__name__}")
+        _die(path + suffix, f"must be {expected_type.__name__}")
 
 
-def _ensure_keys(mapping: Mapping[str, Any], allowed: Iterable[str], path: str) -> None:
-    allowed_set = set(allowed)
-    unknown = sorted(set(mapping.keys()) - allowed_set)
+def _ensure_keys(
+    mapping: Mapping[str, Any], allowed: AbstractSet[str], path: str
+) -> None:
+    unknown = mapping.keys() - allowed
     if unknown:
-        _die(path, f"unknown keys: {', '.join(unknown)}")
+        _die(path, f"unknown keys: {', '.join(sorted(unknown))}")
 
 
 def _expect_non_empty_string(value: Any, path: str) -> str:
@@ -85,23 +255,54 @@ def _expect_non_empty_string(value: Any, path: str) -> str:
     return value
 
 
+def _expect_choice(
+    value: Any, allowed: AbstractSet[str], message: str, path: str, suffix: str = ""
+) -> str:
+    # One membership test on the valid path; the enum sets only hold non-empty
+    # strings, so the string check is only needed to pick the error message.
+    if not (isinstance(value, str) and value in allowed):
+        _expect_non_empty_string(value, path + suffix)
+        _die(path + suffix, message)
+    return value
+
+
 def _expect_string_list(
     value: Any, path: str, *, non_empty: bool = True
 ) -> Sequence[str]:
     _expect_type(value, list, path)
-    out = []
-    for idx, item in enumerate(value):
-        out.append(_expect_non_empty_string(item, f"{path}[{idx}]"))
-    if non_empty and not out:
+    if not all(isinstance(item, str) and item.strip() for item in value):
+        # Only walk the list again (building indexed paths) to report the offender.
+        for idx, item in enumerate(value):
+            _expect_non_empty_string(item, f"{path}[{idx}]")
+    if non_empty and not value:
         _die(path, "must not be empty")
-    return out
+    return value
+
+
+def _parse_yaml(path: str) -> Any:
+    # libyaml decodes UTF-8 itself; handing it bytes skips a Python-side decode.
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    # mtime_ns/size are only part of the key so that edits miss the cache.
+    return _parse_yaml(path)
 
 
 def _load_yaml(path: str) -> Dict[str, Any]:
-    if not os.path.isfile(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         _die(path, "file not found")
-    with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    if cache_enabled():
+        key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+        data = copy.deepcopy(_parse_yaml_cached(*key))
+    else:
+        data = _parse_yaml(path)
     if data is None:
         _die(path, "file is empty")
     if not isinstance(data, dict):
@@ -114,11 +315,9 @@ def _validate_expected_files(root: str, subdir: str) -> None:
     if not os.path.isdir(dir_path):
         _die(dir_path, "directory not found")
 
-    found = {
-        name
-        for name in os.listdir(dir_path)
-        if os.path.isfile(os.path.join(dir_path, name)) and name.endswith(".yaml")
-    }
+    # DirEntry.is_file() uses the type from the directory listing; no stat per name.
+    with os.scandir(dir_path) as it:
+        found = {e.name for e in it if e.name.endswith(".yaml") and e.is_file()}
     expected = EXPECTED_FILES[subdir]
 
     missing = sorted(expected - found)
@@ -132,32 +331,13 @@ def _validate_expected_files(root: str, subdir: str) -> None:
 
 
 def _validate_step_default(path: str, step_node: Dict[str, Any]) -> None:
-    _ensure_keys(
-        step_node,
-        {"default_tool", "default_mode", "web_research_mode", "description"},
-        path,
-    )
+    _ensure_keys(step_node, _STEP_DEFAULT_KEYS, path)
 
-    default_tool = _expect_non_empty_string(
-        step_node.get("default_tool"), f"{path}.default_tool"
-    )
-    if default_tool not in TOOLS:
-        _die(f"{path}.default_tool", f"must be one of: {', '.join(TOOLS)}")
-
-    default_mode = _expect_non_empty_string(
-        step_node.get("default_mode"), f"{path}.default_mode"
-    )
-    if default_mode not in DEFAULT_MODES:
-        _die(f"{path}.default_mode", f"must be one of: {', '.join(DEFAULT_MODES)}")
+    for key, allowed, message in _STEP_DEFAULT_FIELDS:
+        _expect_choice(step_node.get(key), allowed, message, path, "." + key)
 
-    web_mode = _expect_non_empty_string(
-        step_node.get("web_research_mode"), f"{path}.web_research_mode"
-    )
-    if web_mode not in WEB_RESEARCH_MODES:
-        _die(
-            f"{path}.web_research_mode",
-            f"must be one of: {', '.join(WEB_RESEARCH_MODES)}",
-        )
+    default_tool = step_node["default_tool"]
+    web_mode = step_node["web_research_mode"]
     if web_mode != "off" and web_mode not in TOOL_WEB_MODE_MAP[default_tool]:
         _die(
             f"{path}.web_research_mode",
@@ -166,11 +346,7 @@ def _validate_step_default(path: str, step_node: Dict[str, Any]) -> None:
 
 
 def _validate_skill_file(node: Dict[str, Any], skill: str, path: str) -> Dict[str, Any]:
-    _ensure_keys(
-        node,
-        {"version", "skill", "default_method_ids", "methods", "step_defaults"},
-        path,
-    )
+    _ensure_keys(node, _SKILL_KEYS, path)
 
     if node.get("version") != 2:
         _die(f"{path}.version", "must be 2")
@@ -183,42 +359,37 @@ def _validate_skill_file(node: Dict[str, Any], skill: str, path: str) -> Dict[st
     )
 
     methods = node.get("methods")
-    _expect_type(methods, dict, f"{path}.methods")
+    _expect_type(methods, dict, path, ".methods")
     if not methods:
         _die(f"{path}.methods", "must define at least one method")
 
+    all_method_steps: Set[str] = set()
     for method_id, method_node in methods.items():
         method_path = f"{path}.methods.{method_id}"
-        _expect_type(method_node, dict, method_path)
-        _ensure_keys(
-            method_node,
-            {"enabled", "steps", "allowed_tools", "gate_profile"},
-            method_path,
-        )
+        if not isinstance(method_node, dict):
+            _die(method_path, "must be dict")
+        _ensure_keys(method_node, _METHOD_KEYS, method_path)
 
         enabled = method_node.get("enabled")
         if not isinstance(enabled, bool):
             _die(f"{method_path}.enabled", "must be boolean")
 
         steps = _expect_string_list(method_node.get("steps"), f"{method_path}.steps")
+        all_method_steps.update(steps)
         allowed_tools = _expect_string_list(
             method_node.get("allowed_tools"), f"{method_path}.allowed_tools"
         )
         for idx, tool in enumerate(allowed_tools):
-            if tool not in TOOLS:
-                _die(
-                    f"{method_path}.allowed_tools[{idx}]",
-                    f"must be one of: {', '.join(TOOLS)}",
-                )
+            if tool not in _TOOL_SET:
+                _die(f"{method_path}.allowed_tools[{idx}]", _ONE_OF_TOOLS)
 
-        gate_profile = _expect_non_empty_string(
-            method_node.get("gate_profile"), f"{method_path}.gate_profile"
+        _expect_choice(
+            method_node.get("gate_profile"),
+            _GATE_PROFILE_SET,
+            _ONE_OF_GATE_PROFILES,
+            method_path,
+            ".gate_profile",
         )
-        if gate_profile not in GATE_PROFILES:
-            _die(
-                f"{method_path}.gate_profile",
-                f"must be one of: {', '.join(GATE_PROFILES)}",
-            )
 
         if enabled and not steps:
             _die(f"{method_path}.steps", "enabled method must have at least one step")
@@ -231,31 +402,33 @@ def _validate_skill_file(node: Dict[str, Any], skill: str, path: str) -> Dict[st
             )
 
     step_defaults = node.get("step_defaults")
-    _expect_type(step_defaults, dict, f"{path}.step_defaults")
+    _expect_type(step_defaults, dict, path, ".step_defaults")
     if not step_defaults:
         _die(f"{path}.step_defaults", "must define at least one step default")
 
-    all_method_steps = set()
-    for method_id, method_node in methods.items():
-        method_steps = method_node.get("steps") or []
-        all_method_steps.update(method_steps)
-        for step in method_steps:
-            if step not in step_defaults:
+    if not all_method_steps <= step_defaults.keys():
+        # Name the first method (in file order) that references a missing step.
+        for method_id, method_node in methods.items():
+            for step in method_node["steps"]:
+                if step not in step_defaults:
+                    _die(
+                        f"{path}.methods.{method_id}.steps",
+                        f"step '{step}' missing from step_defaults",
+                    )
+
+    # An unreferenced step is reported ahead of any invalid step default.
+    if not step_defaults.keys() <= all_method_steps:
+        for step_id in step_defaults:
+            if step_id not in all_method_steps:
                 _die(
-                    f"{path}.methods.{method_id}.steps",
-                    f"step '{step}' missing from step_defaults",
+                    f"{path}.step_defaults.{step_id}",
+                    "step is not referenced by any method",
                 )
 
-    for step_id in step_defaults.keys():
-        if step_id not in all_method_steps:
-            _die(
-                f"{path}.step_defaults.{step_id}",
-                "step is not referenced by any method",
-            )
-
     for step_id, step_node in step_defaults.items():
         step_path = f"{path}.step_defaults.{step_id}"
-        _expect_type(step_node, dict, step_path)
+        if not isinstance(step_node, dict):
+            _die(step_path, "must be dict")
         _validate_step_default(step_path, step_node)
 
     return node
@@ -264,25 +437,7 @@ def _validate_skill_file(node: Dict[str, Any], skill: str, path: str) -> Dict[st
 def _validate_servant_file(
     node: Dict[str, Any], tool: str, path: str
 ) -> Dict[str, Any]:
-    # Allow v1 runtime fields (purpose_models, purpose_efforts) as optional
-    # extensions so that a single servant file can satisfy both the v1 runtime
-    # (config_resolve.py reads purpose_models/purpose_efforts) and this v2
-    # validator. See config_validate.py::_normalize_servant_file for the mirror.
-    _ensure_keys(
-        node,
-        {
-            "version",
-            "tool",
-            "default_model",
-            "allowed_models",
-            "wrapper_defaults",
-            "web_capabilities",
-            "purpose_models",  # v1 runtime extension — optional
-            "purpose_efforts",  # v1 runtime extension — optional
-            "effort_level_descriptions",  # documentation only — optional
-        },
-        path,
-    )
+    _ensure_keys(node, _SERVANT_KEYS, path)
 
     if node.get("version") != 2:
         _die(f"{path}.version", "must be 2")
@@ -301,31 +456,24 @@ def _validate_servant_file(
         _die(f"{path}.default_model", "must be included in allowed_models")
 
     wrapper_defaults = node.get("wrapper_defaults")
-    _expect_type(wrapper_defaults, dict, f"{path}.wrapper_defaults")
-    # Allow v1 tool-specific keys (effort, approval_mode, sandbox) as optional
-    # extensions so that a single servant file satisfies both validators.
-    _ensure_keys(
-        wrapper_defaults,
-        {"timeout_ms", "timeout_mode", "effort", "approval_mode", "sandbox"},
-        f"{path}.wrapper_defaults",
-    )
+    _expect_type(wrapper_defaults, dict, path, ".wrapper_defaults")
+    _ensure_keys(wrapper_defaults, _WRAPPER_DEFAULTS_KEYS, f"{path}.wrapper_defaults")
 
     timeout_ms = wrapper_defaults.get("timeout_ms")
     if not isinstance(timeout_ms, int) or timeout_ms < 0:
         _die(f"{path}.wrapper_defaults.timeout_ms", "must be a non-negative integer")
 
-    timeout_mode = _expect_non_empty_string(
-        wrapper_defaults.get("timeout_mode"), f"{path}.wrapper_defaults.timeout_mode"
+    _expect_choice(
+        wrapper_defaults.get("timeout_mode"),
+        _TIMEOUT_MODE_SET,
+        _ONE_OF_TIMEOUT_MODES,
+        path,
+        ".wrapper_defaults.timeout_mode",
     )
-    if timeout_mode not in TIMEOUT_MODES:
-        _die(
-            f"{path}.wrapper_defaults.timeout_mode",
-            f"must be one of: {', '.join(TIMEOUT_MODES)}",
-        )
 
     web_capabilities = node.get("web_capabilities")
-    _expect_type(web_capabilities, dict, f"{path}.web_capabilities")
-    _ensure_keys(web_capabilities, {"modes"}, f"{path}.web_capabilities")
+    _expect_type(web_capabilities, dict, path, ".web_capabilities")
+    _ensure_keys(web_capabilities, _WEB_CAPABILITIES_KEYS, f"{path}.web_capabilities")
 
     modes = _expect_string_list(
         web_capabilities.get("modes"), f"{path}.web_capabilities.modes"
@@ -333,10 +481,7 @@ def _validate_servant_file(
     allowed_modes = TOOL_WEB_MODE_MAP[tool]
     for idx, mode in enumerate(modes):
         if mode not in allowed_modes:
-            _die(
-                f"{path}.web_capabilities.modes[{idx}]",
-                f"must be one of: {', '.join(sorted(allowed_modes))}",
-            )
+            _die(f"{path}.web_capabilities.modes[{idx}]", _ONE_OF_TOOL_WEB_MODES[tool])
     if "off" not in modes:
         _die(f"{path}.web_capabilities.modes", "must include 'off'")
 
@@ -344,74 +489,53 @@ def _validate_servant_file(
 
 
 def _validate_routing_policy(node: Dict[str, Any], path: str) -> Dict[str, Any]:
-    _ensure_keys(
-        node,
-        {
-            "version",
-            "stop_policy",
-            "confidence_policy",
-            "hard_stop_reason_map",
-            "reproducibility_policy",
-            "route_decider_policy",
-        },
-        path,
-    )
+    _ensure_keys(node, _ROUTING_KEYS, path)
 
     if node.get("version") != 2:
         _die(f"{path}.version", "must be 2")
 
     stop_policy = node.get("stop_policy")
-    _expect_type(stop_policy, dict, f"{path}.stop_policy")
-    _ensure_keys(stop_policy, {"conditions", "on_stop"}, f"{path}.stop_policy")
+    _expect_type(stop_policy, dict, path, ".stop_policy")
+    _ensure_keys(stop_policy, _STOP_POLICY_KEYS, f"{path}.stop_policy")
 
     conditions = stop_policy.get("conditions")
-    _expect_type(conditions, list, f"{path}.stop_policy.conditions")
+    _expect_type(conditions, list, path, ".stop_policy.conditions")
     if not conditions:
         _die(f"{path}.stop_policy.conditions", "must not be empty")
 
     for idx, cond in enumerate(conditions):
         cond_path = f"{path}.stop_policy.conditions[{idx}]"
-        _expect_type(cond, dict, cond_path)
-        _ensure_keys(
-            cond,
-            {
-                "impact_surface",
-                "confidence",
-                "reason_codes_contain",
-                "strict_evidence_violation",
-                "action",
-            },
-            cond_path,
-        )
+        if not isinstance(cond, dict):
+            _die(cond_path, "must be dict")
+        _ensure_keys(cond, _STOP_CONDITION_KEYS, cond_path)
 
         if "action" not in cond:
             _die(cond_path, "missing required key: action")
-        action = _expect_non_empty_string(cond.get("action"), f"{cond_path}.action")
-        if action not in ROUTING_STOP_ACTIONS:
-            _die(
-                f"{cond_path}.action",
-                f"must be one of: {', '.join(sorted(ROUTING_STOP_ACTIONS))}",
-            )
+        _expect_choice(
+            cond["action"],
+            ROUTING_STOP_ACTIONS,
+            _ONE_OF_STOP_ACTIONS,
+            cond_path,
+            ".action",
+        )
 
         if "impact_surface" in cond:
-            impact = _expect_non_empty_string(
-                cond.get("impact_surface"), f"{cond_path}.impact_surface"
+            _expect_choice(
+                cond["impact_surface"],
+                ROUTING_IMPACT_SURFACES,
+                _ONE_OF_IMPACT_SURFACES,
+                cond_path,
+                ".impact_surface",
             )
-            if impact not in ROUTING_IMPACT_SURFACES:
-                _die(
-                    f"{cond_path}.impact_surface",
-                    f"must be one of: {', '.join(sorted(ROUTING_IMPACT_SURFACES))}",
-                )
 
         if "confidence" in cond:
-            confidence = _expect_non_empty_string(
-                cond.get("confidence"), f"{cond_path}.confidence"
+            _expect_choice(
+                cond["confidence"],
+                ROUTING_CONFIDENCE_VALUES,
+                _ONE_OF_CONFIDENCE_VALUES,
+                cond_path,
+                ".confidence",
             )
-            if confidence not in ROUTING_CONFIDENCE_VALUES:
-                _die(
-                    f"{cond_path}.confidence",
-                    f"must be one of: {', '.join(sorted(ROUTING_CONFIDENCE_VALUES))}",
-                )
 
         if "reason_codes_contain" in cond:
             _expect_non_empty_string(
@@ -422,28 +546,26 @@ def _validate_routing_policy(node: Dict[str, Any], path: str) -> Dict[str, Any]:
             if not isinstance(cond.get("strict_evidence_violation"), bool):
                 _die(f"{cond_path}.strict_evidence_violation", "must be boolean")
 
-    on_stop = _expect_non_empty_string(
-        stop_policy.get("on_stop"), f"{path}.stop_policy.on_stop"
+    _expect_choice(
+        stop_policy.get("on_stop"),
+        ROUTING_STOP_ON_STOP,
+        _ONE_OF_ON_STOP,
+        path,
+        ".stop_policy.on_stop",
     )
-    if on_stop not in ROUTING_STOP_ON_STOP:
-        _die(
-            f"{path}.stop_policy.on_stop",
-            f"must be one of: {', '.join(sorted(ROUTING_STOP_ON_STOP))}",
-        )
 
     confidence_policy = node.get("confidence_policy")
-    _expect_type(confidence_policy, dict, f"{path}.confidence_policy")
-    _ensure_keys(confidence_policy, {"values", "default"}, f"{path}.confidence_policy")
+    _expect_type(confidence_policy, dict, path, ".confidence_policy")
+    _ensure_keys(
+        confidence_policy, _CONFIDENCE_POLICY_KEYS, f"{path}.confidence_policy"
+    )
 
     values = _expect_string_list(
         confidence_policy.get("values"), f"{path}.confidence_policy.values"
     )
     values_set = set(values)
     if not values_set.issubset(ROUTING_CONFIDENCE_VALUES):
-        _die(
-            f"{path}.confidence_policy.values",
-            f"must be subset of: {', '.join(sorted(ROUTING_CONFIDENCE_VALUES))}",
-        )
+        _die(f"{path}.confidence_policy.values", _SUBSET_OF_CONFIDENCE_VALUES)
     default_confidence = _expect_non_empty_string(
         confidence_policy.get("default"), f"{path}.confidence_policy.default"
     )
@@ -454,7 +576,7 @@ def _validate_routing_policy(node: Dict[str, Any], path: str) -> Dict[str, Any]:
         )
 
     hard_stop_reason_map = node.get("hard_stop_reason_map")
-    _expect_type(hard_stop_reason_map, dict, f"{path}.hard_stop_reason_map")
+    _expect_type(hard_stop_reason_map, dict, path, ".hard_stop_reason_map")
     if not hard_stop_reason_map:
         _die(f"{path}.hard_stop_reason_map", "must not be empty")
     for reason_code, reason_msg in hard_stop_reason_map.items():
@@ -464,39 +586,35 @@ def _validate_routing_policy(node: Dict[str, Any], path: str) -> Dict[str, Any]:
         )
 
     reproducibility_policy = node.get("reproducibility_policy")
-    _expect_type(reproducibility_policy, dict, f"{path}.reproducibility_policy")
+    _expect_type(reproducibility_policy, dict, path, ".reproducibility_policy")
     _ensure_keys(
         reproducibility_policy,
-        {"deterministic_required", "on_mismatch"},
+        _REPRODUCIBILITY_KEYS,
         f"{path}.reproducibility_policy",
     )
     if not isinstance(reproducibility_policy.get("deterministic_required"), bool):
         _die(f"{path}.reproducibility_policy.deterministic_required", "must be boolean")
-    on_mismatch = _expect_non_empty_string(
+    _expect_choice(
         reproducibility_policy.get("on_mismatch"),
-        f"{path}.reproducibility_policy.on_mismatch",
+        REPRODUCIBILITY_ON_MISMATCH,
+        _ONE_OF_ON_MISMATCH,
+        path,
+        ".reproducibility_policy.on_mismatch",
     )
-    if on_mismatch not in REPRODUCIBILITY_ON_MISMATCH:
-        _die(
-            f"{path}.reproducibility_policy.on_mismatch",
-            f"must be one of: {', '.join(sorted(REPRODUCIBILITY_ON_MISMATCH))}",
-        )
 
     route_decider_policy = node.get("route_decider_policy")
-    _expect_type(route_decider_policy, dict, f"{path}.route_decider_policy")
+    _expect_type(route_decider_policy, dict, path, ".route_decider_policy")
     _ensure_keys(
-        route_decider_policy,
-        {"phase_prompt_paths", "schema_version"},
-        f"{path}.route_decider_policy",
+        route_decider_policy, _ROUTE_DECIDER_KEYS, f"{path}.route_decider_policy"
     )
 
     phase_prompt_paths = route_decider_policy.get("phase_prompt_paths")
     _expect_type(
-        phase_prompt_paths, dict, f"{path}.route_decider_policy.phase_prompt_paths"
+        phase_prompt_paths, dict, path, ".route_decider_policy.phase_prompt_paths"
     )
     _ensure_keys(
         phase_prompt_paths,
-        set(PHASES),
+        _PHASE_SET,
         f"{path}.route_decider_policy.phase_prompt_paths",
     )
     for phase in PHASES:
@@ -512,54 +630,23 @@ def _validate_routing_policy(node: Dict[str, Any], path: str) -> Dict[str, Any]:
 
 
 def _validate_review_parallel_policy(node: Dict[str, Any], path: str) -> Dict[str, Any]:
-    _ensure_keys(
-        node,
-        {
-            "version",
-            "mode",
-            "join_barrier",
-            "apply_order",
-            "worker_output_mode",
-            "merge_required",
-            "artifacts",
-        },
-        path,
-    )
+    _ensure_keys(node, _REVIEW_PARALLEL_KEYS, path)
 
     if node.get("version") != 2:
         _die(f"{path}.version", "must be 2")
 
-    mode = _expect_non_empty_string(node.get("mode"), f"{path}.mode")
-    if mode != REVIEW_PARALLEL_MODE:
-        _die(f"{path}.mode", f"must be '{REVIEW_PARALLEL_MODE}'")
-
-    join_barrier = _expect_non_empty_string(
-        node.get("join_barrier"), f"{path}.join_barrier"
-    )
-    if join_barrier != REVIEW_PARALLEL_JOIN_BARRIER:
-        _die(f"{path}.join_barrier", f"must be '{REVIEW_PARALLEL_JOIN_BARRIER}'")
-
-    apply_order = _expect_non_empty_string(
-        node.get("apply_order"), f"{path}.apply_order"
-    )
-    if apply_order != REVIEW_PARALLEL_APPLY_ORDER:
-        _die(f"{path}.apply_order", f"must be '{REVIEW_PARALLEL_APPLY_ORDER}'")
-
-    worker_output_mode = _expect_non_empty_string(
-        node.get("worker_output_mode"), f"{path}.worker_output_mode"
-    )
-    if worker_output_mode != REVIEW_PARALLEL_WORKER_OUTPUT_MODE:
-        _die(
-            f"{path}.worker_output_mode",
-            f"must be '{REVIEW_PARALLEL_WORKER_OUTPUT_MODE}'",
-        )
+    for key, required in _REVIEW_PARALLEL_FIXED:
+        value = node.get(key)
+        if value != required:
+            _expect_non_empty_string(value, f"{path}.{key}")
+            _die(f"{path}.{key}", f"must be '{required}'")
 
     if not isinstance(node.get("merge_required"), bool):
         _die(f"{path}.merge_required", "must be boolean")
 
     artifacts = node.get("artifacts")
-    _expect_type(artifacts, dict, f"{path}.artifacts")
-    _ensure_keys(artifacts, {"findings_dir", "merged", "queue"}, f"{path}.artifacts")
+    _expect_type(artifacts, dict, path, ".artifacts")
+    _ensure_keys(artifacts, _ARTIFACT_KEYS, f"{path}.artifacts")
     for key in ("findings_dir", "merged", "queue"):
         _expect_non_empty_string(artifacts.get(key), f"{path}.artifacts.{key}")
 
@@ -567,27 +654,18 @@ def _validate_review_parallel_policy(node: Dict[str, Any], path: str) -> Dict[st
 
 
 def _validate_web_evidence_policy(node: Dict[str, Any], path: str) -> Dict[str, Any]:
-    _ensure_keys(
-        node,
-        {
-            "version",
-            "strictness",
-            "required_fields",
-            "reason_code_map",
-            "gate_action_on_violation",
-        },
-        path,
-    )
+    _ensure_keys(node, _WEB_EVIDENCE_KEYS, path)
 
     if node.get("version") != 2:
         _die(f"{path}.version", "must be 2")
 
-    strictness = _expect_non_empty_string(node.get("strictness"), f"{path}.strictness")
-    if strictness not in WEB_EVIDENCE_STRICTNESS:
-        _die(
-            f"{path}.strictness",
-            f"must be one of: {', '.join(sorted(WEB_EVIDENCE_STRICTNESS))}",
-        )
+    _expect_choice(
+        node.get("strictness"),
+        WEB_EVIDENCE_STRICTNESS,
+        _ONE_OF_STRICTNESS,
+        path,
+        ".strictness",
+    )
 
     required_fields = set(
         _expect_string_list(node.get("required_fields"), f"{path}.required_fields")
@@ -599,68 +677,78 @@ def _validate_web_evidence_policy(node: Dict[str, Any], path: str) -> Dict[str,
         )
 
     reason_code_map = node.get("reason_code_map")
-    _expect_type(reason_code_map, dict, f"{path}.reason_code_map")
+    _expect_type(reason_code_map, dict, path, ".reason_code_map")
     _ensure_keys(reason_code_map, WEB_EVIDENCE_REASON_CODES, f"{path}.reason_code_map")
     for code, msg in reason_code_map.items():
         _expect_non_empty_string(code, f"{path}.reason_code_map.<key>")
         _expect_non_empty_string(msg, f"{path}.reason_code_map.{code}")
 
-    gate_action = _expect_non_empty_string(
+    _expect_choice(
         node.get("gate_action_on_violation"),
-        f"{path}.gate_action_on_violation",
+        WEB_EVIDENCE_GATE_ACTIONS,
+        _ONE_OF_GATE_ACTIONS,
+        path,
+        ".gate_action_on_violation",
     )
-    if gate_action not in WEB_EVIDENCE_GATE_ACTIONS:
-        _die(
-            f"{path}.gate_action_on_violation",
-            f"must be one of: {', '.join(sorted(WEB_EVIDENCE_GATE_ACTIONS))}",
-        )
 
     return node
 
 
+# (cfg section, key, path under the config root, validator, validator args)
+ConfigFile = Tuple[str, str, str, Callable[..., Dict[str, Any]], Tuple[str, ...]]
+
+# Every input file, in load order.
+_CONFIG_FILES: Tuple[ConfigFile, ...] = (
+    *(("skills", p, f"skills/{p}.yaml", _validate_skill_file, (p,)) for p in PHASES),
+    *(
+        ("servants", t, f"servants/{t}.yaml", _validate_servant_file, (t,))
+        for t in TOOLS
+    ),
+    ("policies", "routing", "policies/routing.yaml", _validate_routing_policy, ()),
+    (
+        "policies",
+        "review_parallel",
+        "policies/review_parallel.yaml",
+        _validate_review_parallel_policy,
+        (),
+    ),
+    (
+        "policies",
+        "web_evidence",
+        "policies/web_evidence.yaml",
+        _validate_web_evidence_policy,
+        (),
+    ),
+)
+
+
+def clear_cache() -> None:
+    """Drop in-process YAML parse results."""
+    _parse_yaml_cached.cache_clear()
+
+
 def load_and_validate_v2_config(config_root: str) -> Dict[str, Any]:
+    """Load and validate the V2 config under config_root.
+
+    Every call validates from scratch; callers that load repeatedly go through
+    config_cache.cached_load("v2-config", ...), which memoizes the result.
+    """
     root = os.path.abspath(config_root)
 
     for subdir in ("skills", "servants", "policies"):
         _validate_expected_files(root, subdir)
 
-    skills: Dict[str, Any] = {}
-    for phase in PHASES:
-        path = os.path.join(root, "skills", f"{phase}.yaml")
-        node = _load_yaml(path)
-        skills[phase] = _validate_skill_file(node, phase, path)
-
-    servants: Dict[str, Any] = {}
-    for tool in TOOLS:
-        path = os.path.join(root, "servants", f"{tool}.yaml")
-        node = _load_yaml(path)
-        servants[tool] = _validate_servant_file(node, tool, path)
-
-    policies: Dict[str, Any] = {}
-    routing_path = os.path.join(root, "policies", "routing.yaml")
-    policies["routing"] = _validate_routing_policy(
-        _load_yaml(routing_path), routing_path
-    )
-
-    review_parallel_path = os.path.join(root, "policies", "review_parallel.yaml")
-    policies["review_parallel"] = _validate_review_parallel_policy(
-        _load_yaml(review_parallel_path),
-        review_parallel_path,
-    )
-
-    web_evidence_path = os.path.join(root, "policies", "web_evidence.yaml")
-    policies["web_evidence"] = _validate_web_evidence_policy(
-        _load_yaml(web_evidence_path),
-        web_evidence_path,
-    )
-
-    return {
+    paths = [os.path.join(root, entry[2]) for entry in _CONFIG_FILES]
+    cfg: Dict[str, Any] = {
         "version": 2,
         "root": root,
-        "skills": skills,
-        "servants": servants,
-        "policies": policies,
+        "skills": {},
+        "servants": {},
+        "policies": {},
     }
+    for (section, key, _, validator, args), path in zip(_CONFIG_FILES, paths):
+        cfg[section][key] = validator(_load_yaml(path), *args, path)
+    return cfg
 
 
 def load_manifest_if_present(path: Optional[str]) -> Optional[Dict[str, Any]]:
@@ -675,7 +763,7 @@ def _normalize_phase_override(
     node: Dict[str, Any],
     path: str,
 ) -> Dict[str, Any]:
-    _ensure_keys(node, {"method_id", "tool_models", "step_overrides"}, path)
+    _ensure_keys(node, _PHASE_OVERRIDE_KEYS, path)
 
     out: Dict[str, Any] = {}
 
@@ -690,8 +778,8 @@ def _normalize_phase_override(
         out["method_id"] = method_id
 
     tool_models = node.get("tool_models") or {}
-    _expect_type(tool_models, dict, f"{path}.tool_models")
-    _ensure_keys(tool_models, set(TOOLS), f"{path}.tool_models")
+    _expect_type(tool_models, dict, path, ".tool_models")
+    _ensure_keys(tool_models, _TOOL_SET, f"{path}.tool_models")
     normalized_tool_models: Dict[str, str] = {}
     for tool, model in tool_models.items():
         model_name = _expect_non_empty_string(model, f"{path}.tool_models.{tool}")
@@ -705,7 +793,7 @@ def _normalize_phase_override(
     out["tool_models"] = normalized_tool_models
 
     step_overrides = node.get("step_overrides") or {}
-    _expect_type(step_overrides, dict, f"{path}.step_overrides")
+    _expect_type(step_overrides, dict, path, ".step_overrides")
 
     step_defaults = cfg["skills"][phase]["step_defaults"]
     normalized_step_overrides: Dict[str, Dict[str, Any]] = {}
@@ -713,43 +801,18 @@ def _normalize_phase_override(
         step_path = f"{path}.step_overrides.{step_id}"
         if step_id not in step_defaults:
             _die(step_path, f"unknown step_id '{step_id}' for phase '{phase}'")
-        _expect_type(step_node, dict, step_path)
-        _ensure_keys(
-            step_node, {"tool", "model", "default_mode", "web_research_mode"}, step_path
-        )
+        if not isinstance(step_node, dict):
+            _die(step_path, "must be dict")
+        _ensure_keys(step_node, _STEP_OVERRIDE_KEYS, step_path)
 
         normalized_step: Dict[str, Any] = {}
 
-        tool = step_node.get("tool")
-        if tool is not None:
-            tool_value = _expect_non_empty_string(tool, f"{step_path}.tool")
-            if tool_value not in TOOLS:
-                _die(f"{step_path}.tool", f"must be one of: {', '.join(TOOLS)}")
-            normalized_step["tool"] = tool_value
-
-        default_mode = step_node.get("default_mode")
-        if default_mode is not None:
-            default_mode_value = _expect_non_empty_string(
-                default_mode, f"{step_path}.default_mode"
-            )
-            if default_mode_value not in DEFAULT_MODES:
-                _die(
-                    f"{step_path}.default_mode",
-                    f"must be one of: {', '.join(DEFAULT_MODES)}",
-                )
-            normalized_step["default_mode"] = default_mode_value
-
-        web_research_mode = step_node.get("web_research_mode")
-        if web_research_mode is not None:
-            web_mode_value = _expect_non_empty_string(
-                web_research_mode, f"{step_path}.web_research_mode"
-            )
-            if web_mode_value not in WEB_RESEARCH_MODES:
-                _die(
-                    f"{step_path}.web_research_mode",
-                    f"must be one of: {', '.join(WEB_RESEARCH_MODES)}",
+        for key, allowed, message in _STEP_OVERRIDE_FIELDS:
+            value = step_node.get(key)
+            if value is not None:
+                normalized_step[key] = _expect_choice(
+                    value, allowed, message, step_path, "." + key
                 )
-            normalized_step["web_research_mode"] = web_mode_value
 
         model = step_node.get("model")
         if model is not None:
@@ -807,18 +870,19 @@ def parse_manifest_v2_overrides(
     if config_v2 is None:
         return out
 
-    _expect_type(config_v2, dict, f"{manifest_path}.config_v2")
-    _ensure_keys(config_v2, {"phase_overrides"}, f"{manifest_path}.config_v2")
+    _expect_type(config_v2, dict, manifest_path, ".config_v2")
+    _ensure_keys(config_v2, _CONFIG_V2_KEYS, f"{manifest_path}.config_v2")
 
     phase_overrides = config_v2.get("phase_overrides") or {}
-    _expect_type(phase_overrides, dict, f"{manifest_path}.config_v2.phase_overrides")
+    _expect_type(phase_overrides, dict, manifest_path, ".config_v2.phase_overrides")
     _ensure_keys(
-        phase_overrides, set(PHASES), f"{manifest_path}.config_v2.phase_overrides"
+        phase_overrides, _PHASE_SET, f"{manifest_path}.config_v2.phase_overrides"
     )
 
     for phase, node in phase_overrides.items():
         phase_path = f"{manifest_path}.config_v2.phase_overrides.{phase}"
-        _expect_type(node, dict, phase_path)
+        if not isinstance(node, dict):
+            _die(phase_path, "must be dict")
         out["phase_overrides"][phase] = _normalize_phase_override(
             cfg, phase, node, phase_path
         )
@@ -834,31 +898,88 @@ def validate_manifest_v2_overrides(
     parse_manifest_v2_overrides(cfg, manifest, manifest_path=manifest_path)
 
 
+# The enum half of the choices catalog depends only on module constants.
+_CHOICE_ENUMS: Dict[str, Any] = {
+    "tools": sorted(TOOLS),
+    "phases": sorted(PHASES),
+    "default_mode": sorted(DEFAULT_MODES),
+    "web_research_mode": sorted(WEB_RESEARCH_MODES),
+    "gate_profile": sorted(GATE_PROFILES),
+    "timeout_mode": sorted(TIMEOUT_MODES),
+    "routing_stop_action": sorted(ROUTING_STOP_ACTIONS),
+}
+_CHOICE_WEB_CAPABILITIES: Dict[str, Any] = {
+    tool: sorted(modes) for tool, modes in TOOL_WEB_MODE_MAP.items()
+}
+
+
 def build_choices_catalog(cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """Allowed enums/models for cfg; the enum lists are shared, treat as read-only."""
+    servants = cfg["servants"]
     return {
         "version": 2,
-        "enums": {
-            "tools": sorted(TOOLS),
-            "phases": sorted(PHASES),
-            "default_mode": sorted(DEFAULT_MODES),
-            "web_research_mode": sorted(WEB_RESEARCH_MODES),
-            "gate_profile": sorted(GATE_PROFILES),
-            "timeout_mode": sorted(TIMEOUT_MODES),
-            "routing_stop_action": sorted(ROUTING_STOP_ACTIONS),
-        },
-        "tool_web_capabilities": {
-            tool: sorted(modes) for tool, modes in TOOL_WEB_MODE_MAP.items()
-        },
+        "enums": _CHOICE_ENUMS,
+        "tool_web_capabilities": _CHOICE_WEB_CAPABILITIES,
         "servants": {
             tool: {
-                "default_model": cfg["servants"][tool]["default_model"],
-                "allowed_models": list(cfg["servants"][tool]["allowed_models"]),
+                "default_model": servants[tool]["default_model"],
+                "allowed_models": list(servants[tool]["allowed_models"]),
             }
             for tool in TOOLS
         },
     }
 
 
+def _validate(config_root: str, manifest_path: Optional[str]) -> Dict[str, Any]:
+    # Shares the resolver's on-disk entry, so a validate-then-resolve
+    # sequence parses the YAML once.
+    cfg = cached_load("v2-config", config_root, load_and_validate_v2_config)
+    manifest = load_manifest_if_present(manifest_path)
+    validate_manifest_v2_overrides(
+        cfg, manifest, manifest_path=manifest_path or "manifest"
+    )
+    return cfg
+
+
+def _serve(config_root: str) -> int:
+    """Answer newline-delimited JSON validation requests from stdin until EOF.
+
+    Request:  {"manifest": <path or null>, "print_choices": <bool>}
+    Response: {"ok": true} (with "choices" when requested) or
+              {"ok": false, "error": "..."}, echoing "id" when the request carries one.
+
+    The validated config stays in memory and is reloaded when its files change.
+    """
+    out = sys.stdout.buffer
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        response: Dict[str, Any]
+        req: Any = None
+        try:
+            req = json.loads(line)
+            if not isinstance(req, dict):
+                raise ValidationError("request must be a JSON object")
+            cfg = _validate(config_root, req.get("manifest"))
+            response = {"ok": True}
+            if req.get("print_choices"):
+                response["choices"] = build_choices_catalog(cfg)
+        except ValidationError as e:
+            response = {"ok": False, "error": str(e)}
+        except (TypeError, ValueError) as e:
+            response = {"ok": False, "error": f"invalid request: {e}"}
+        except yaml.YAMLError as e:
+            response = {"ok": False, "error": f"YAML parse failed: {e}"}
+        except OSError as e:
+            response = {"ok": False, "error": f"cannot read input: {e}"}
+        if isinstance(req, dict) and "id" in req:
+            response["id"] = req["id"]
+        out.write(dumps_compact_bytes(response))
+        out.write(b"\n")
+        out.flush()
+    return 0
+
+
 def _main() -> int:
     parser = argparse.ArgumentParser(description="Validate Config V2 YAML files")
     parser.add_argument(
@@ -872,14 +993,18 @@ def _main() -> int:
         action="store_true",
         help="Print allowed enum choices and model choices as JSON",
     )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Validate newline-delimited JSON requests from stdin",
+    )
     args = parser.parse_args()
 
+    if args.serve:
+        return _serve(args.config_root)
+
     try:
-        cfg = load_and_validate_v2_config(args.config_root)
-        manifest = load_manifest_if_present(args.manifest)
-        validate_manifest_v2_overrides(
-            cfg, manifest, manifest_path=args.manifest or "manifest"
-        )
+        cfg = _validate(args.config_root, args.manifest)
     except ValidationError as e:
         print(f"CONFIG V2 VALIDATION ERROR: {e}", file=sys.stderr)
         return 1
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""JSON output helpers that use orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+import re
+import sys
+from typing import Any
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Integers of up to 18 digits always fit orjson's int64/uint64 range.
+_LONG_DIGIT_RUN = re.compile(rb"[0-9]{19}")
+
+
+def dumps_sorted_bytes(data: Any) -> bytes:
+    """Serialize as 2-space indented JSON with sorted keys.
+
+    orjson writes non-ASCII characters as UTF-8 instead of \\u escapes; both
+    forms decode to the same value.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        except TypeError:
+            # e.g. non-string keys, which the stdlib encoder coerces.
+            pass
+    return json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+
+
+def dumps_indented_bytes(data: Any) -> bytes:
+    """Serialize as 2-space indented JSON, keeping key order and raw UTF-8.
+
+    Matches json.dumps(data, ensure_ascii=False, indent=2) except for float
+    spelling (orjson writes 1e16 for 1e+16) and NaN/Infinity, which orjson
+    writes as null.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def dumps_compact_bytes(data: Any) -> bytes:
+    """Serialize as single-line JSON with sorted keys (for NDJSON streams)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def loads_bytes(raw: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, with orjson when it is installed.
+
+    Input orjson rejects (NaN, lone surrogates, ...) is re-parsed by the stdlib
+    decoder so that both paths accept and reject the same documents. orjson also
+    reads integers beyond 64 bits as floats, losing digits; documents with a
+    19+ digit run are therefore left to the stdlib, which keeps them exact.
+    """
+    if orjson is not None and _LONG_DIGIT_RUN.search(raw) is None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw.decode("utf-8"))
+
+
+def write_json_stdout(data: Any) -> None:
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+    out.write(dumps_sorted_bytes(data))
+    out.write(b"\n")
+    out.flush()
@@ -4,12 +4,17 @@
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
 
 import yaml
 
+from config_cache import cached_file_load  # type: ignore
+
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 PhasePromptSet = Dict[str, Dict[str, Set[Tuple[str, str]]]]
 
 PHASES = ("plan", "impl", "review")
@@ -31,7 +36,7 @@ def _load_yaml(path: Path) -> dict:
     if not path.is_file():
         raise AuditError(f"missing config file: {path}")
     try:
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+        data = yaml.load(path.read_bytes(), Loader=_YAML_LOADER)
     except Exception as exc:  # pragma: no cover - parser messages vary
         raise AuditError(f"failed to parse YAML at {path}: {exc}") from exc
     if not isinstance(data, dict):
@@ -39,59 +44,71 @@ def _load_yaml(path: Path) -> dict:
     return data
 
 
-def _collect_expected_profiles(config_root: Path) -> PhasePromptSet:
-    expected: PhasePromptSet = {phase: {} for phase in PHASES}
-
-    for phase in PHASES:
-        pipeline_file = config_root / "pipeline" / f"{phase}-pipeline.yaml"
-        pipeline_cfg = _load_yaml(pipeline_file)
-        profiles = pipeline_cfg.get("profiles")
-        if not isinstance(profiles, dict):
-            raise AuditError(f"{pipeline_file}: 'profiles' must be a mapping")
-
-        for profile_name, profile_cfg in profiles.items():
-            if not isinstance(profile_name, str):
-                raise AuditError(f"{pipeline_file}: profile name must be string")
-            if not isinstance(profile_cfg, dict):
+def _pipeline_profiles(pipeline_file: Path) -> Dict[str, Set[Tuple[str, str]]]:
+    """Required (tool, role) prompts per profile of one <phase>-pipeline.yaml."""
+    phase = pipeline_file.name.split("-", 1)[0]
+    pipeline_cfg = _load_yaml(pipeline_file)
+    profiles = pipeline_cfg.get("profiles")
+    if not isinstance(profiles, dict):
+        raise AuditError(f"{pipeline_file}: 'profiles' must be a mapping")
+
+    out: Dict[str, Set[Tuple[str, str]]] = {}
+    for profile_name, profile_cfg in profiles.items():
+        if not isinstance(profile_name, str):
+            raise AuditError(f"{pipeline_file}: profile name must be string")
+        if not isinstance(profile_cfg, dict):
+            raise AuditError(
+                f"{pipeline_file}: profile '{profile_name}' must be a mapping"
+            )
+
+        required: Set[Tuple[str, str]] = set()
+        if phase in {"impl", "review"}:
+            stages = profile_cfg.get("stages")
+            if not isinstance(stages, list) or not stages:
                 raise AuditError(
-                    f"{pipeline_file}: profile '{profile_name}' must be a mapping"
+                    f"{pipeline_file}: profile '{profile_name}' must define non-empty stages"
                 )
-
-            required: Set[Tuple[str, str]] = set()
-            if phase in {"impl", "review"}:
-                stages = profile_cfg.get("stages")
-                if not isinstance(stages, list) or not stages:
+            for stage in stages:
+                if not isinstance(stage, str) or "_" not in stage:
                     raise AuditError(
-                        f"{pipeline_file}: profile '{profile_name}' must define non-empty stages"
+                        f"{pipeline_file}: invalid stage '{stage}' in profile '{profile_name}'"
                     )
-                for stage in stages:
-                    if not isinstance(stage, str) or "_" not in stage:
+                tool, role = stage.split("_", 1)
+                required.add((tool, role))
+        else:
+            stage_models = profile_cfg.get("stage_models")
+            if isinstance(stage_models, dict):
+                for stage_name in stage_models:
+                    if stage_name not in PLAN_PROMPT_MAP:
                         raise AuditError(
-                            f"{pipeline_file}: invalid stage '{stage}' in profile '{profile_name}'"
+                            f"{pipeline_file}: unsupported plan stage '{stage_name}' in profile '{profile_name}'"
                         )
-                    tool, role = stage.split("_", 1)
-                    required.add((tool, role))
-            else:
-                stage_models = profile_cfg.get("stage_models")
-                if isinstance(stage_models, dict):
-                    for stage_name in stage_models:
-                        if stage_name not in PLAN_PROMPT_MAP:
-                            raise AuditError(
-                                f"{pipeline_file}: unsupported plan stage '{stage_name}' in profile '{profile_name}'"
-                            )
-                # Plan pipeline prompt contract is fixed to these 4 templates.
-                required.update(
-                    {
-                        ("copilot", "draft"),
-                        ("shared", "enrich"),
-                        ("shared", "cross_review"),
-                        ("copilot", "consolidate"),
-                    }
-                )
+            # Plan pipeline prompt contract is fixed to these 4 templates.
+            required.update(
+                {
+                    ("copilot", "draft"),
+                    ("shared", "enrich"),
+                    ("shared", "cross_review"),
+                    ("copilot", "consolidate"),
+                }
+            )
 
-            expected[phase][profile_name] = required
+        out[profile_name] = required
 
-    return expected
+    return out
+
+
+def _collect_expected_profiles(config_root: Path) -> PhasePromptSet:
+    # The reduced per-profile sets are cached by file path, mtime and size, so
+    # unchanged pipeline files are neither parsed nor re-checked.
+    return {
+        phase: cached_file_load(
+            "prompt-audit",
+            config_root / "pipeline" / f"{phase}-pipeline.yaml",
+            _pipeline_profiles,
+        )
+        for phase in PHASES
+    }
 
 
 def _default_prompt_path(prompts_root: Path, tool: str, role: str) -> Path:
@@ -101,19 +118,23 @@ def _default_prompt_path(prompts_root: Path, tool: str, role: str) -> Path:
 
 
 def _scan_profile_files(profile_dir: Path) -> Set[Tuple[str, str]]:
+    """(tool_dir, role) for every <profile_dir>/<tool_dir>/<role>.md file."""
     found: Set[Tuple[str, str]] = set()
-    if not profile_dir.is_dir():
+    # Only two levels are ever relevant, and DirEntry type checks come from the
+    # directory listing, so this walks without a stat or Path per entry.
+    try:
+        tools = os.scandir(profile_dir)
+    except (FileNotFoundError, NotADirectoryError):
         return found
-    for md_file in profile_dir.rglob("*.md"):
-        rel = md_file.relative_to(profile_dir).parts
-        if len(rel) != 2:
-            continue
-        tool_dir, file_name = rel
-        if not file_name.endswith(".md"):
-            continue
-        role = file_name[:-3]
-        if role:
-            found.add((tool_dir, role))
+    with tools:
+        for tool in tools:
+            if not tool.is_dir(follow_symlinks=False):
+                continue
+            with os.scandir(tool.path) as files:
+                for f in files:
+                    name = f.name
+                    if len(name) > 3 and name.endswith(".md") and f.is_file():
+                        found.add((tool.name, name[:-3]))
     return found
 
 
@@ -131,21 +152,30 @@ def run_audit(
     unknown_profiles: List[str] = []
 
     for phase in PHASES:
-        configured_profiles = set(expected[phase].keys())
         phase_dir = profiles_root / phase
 
-        if phase_dir.is_dir():
-            for child in sorted(phase_dir.iterdir()):
-                if not child.is_dir():
-                    continue
-                if child.name not in configured_profiles:
-                    unknown_profiles.append(f"{phase}/{child.name}")
+        # One listing of the phase dir serves both the unknown-profile report
+        # and the check for which configured profiles have a directory at all.
+        profile_dirs: Set[str] = set()
+        try:
+            children = os.scandir(phase_dir)
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        else:
+            with children:
+                profile_dirs = {c.name for c in children if c.is_dir()}
+        unknown = profile_dirs - expected[phase].keys()
+        unknown_profiles.extend(f"{phase}/{name}" for name in sorted(unknown))
 
         for profile, required_prompts in sorted(expected[phase].items()):
             profile_dir = phase_dir / profile
-            profile_templates = _scan_profile_files(profile_dir)
+            profile_templates = (
+                _scan_profile_files(profile_dir) if profile in profile_dirs else set()
+            )
 
-            for tool, role in sorted(required_prompts):
+            # Templates the scan already found need no stat of their own; the
+            # is_file() probe only covers what it skips (symlinked tool dirs).
+            for tool, role in sorted(required_prompts - profile_templates):
                 profile_path = profile_dir / tool / f"{role}.md"
                 if profile_path.is_file():
                     continue
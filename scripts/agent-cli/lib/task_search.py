@@ -15,19 +15,29 @@ Usage:
 """
 
 import argparse
-import json
+import heapq
 import os
 import re
+import stat
 import sys
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 
+from config_cache import (  # type: ignore
+    cache_enabled,
+    read_entry,
+    source_fingerprint,
+    write_entry,
+)
+from json_io import dumps_indented_bytes, loads_bytes  # type: ignore
+
 # ── Task name validation ──────────────────────────────────────────────────────
 
 NAME_MIN_LEN = 16
 NAME_MAX_LEN = 72
-NAME_PATTERN = re.compile(r"^[a-z0-9][a-z0-9-]*[a-z0-9]$")
+NAME_PATTERN = re.compile(r"[a-z0-9][a-z0-9-]*[a-z0-9]")
 
 
 def task_name_valid(name: str) -> tuple[bool, str]:
@@ -36,7 +46,7 @@ def task_name_valid(name: str) -> tuple[bool, str]:
         return False, f"too short ({len(name)} < {NAME_MIN_LEN})"
     if len(name) > NAME_MAX_LEN:
         return False, f"too long ({len(name)} > {NAME_MAX_LEN})"
-    if not NAME_PATTERN.match(name):
+    if not NAME_PATTERN.fullmatch(name):
         return False, "must be lowercase alphanum+hyphen, no leading/trailing hyphen"
     return True, "ok"
 
@@ -44,14 +54,10 @@ def task_name_valid(name: str) -> tuple[bool, str]:
 # ── Task index I/O ────────────────────────────────────────────────────────────
 
 
-def load_task_index(task_root: Path) -> Optional[dict]:
-    """Load task-index.json from task root, or None if missing/invalid."""
-    idx_path = task_root / "task-index.json"
-    if not idx_path.is_file():
-        return None
+def _read_index_file(idx_path: str) -> Optional[dict]:
     try:
-        with open(idx_path, encoding="utf-8") as f:
-            data = json.load(f)
+        with open(idx_path, "rb") as f:
+            data = loads_bytes(f.read())
         if not isinstance(data, dict):
             return None
         return data
@@ -59,25 +65,86 @@ def load_task_index(task_root: Path) -> Optional[dict]:
         return None
 
 
+def load_task_index(task_root: Path) -> Optional[dict]:
+    """Load task-index.json from task root, or None if missing/invalid."""
+    idx_path = task_root / "task-index.json"
+    if not idx_path.is_file():
+        return None
+    return _read_index_file(str(idx_path))
+
+
+def load_task_indexes(task_dirs: list[Path], cache_source: str) -> list[Optional[dict]]:
+    """load_task_index() for each dir, reusing earlier parses of unchanged files.
+
+    Parses are kept in one on-disk cache entry per cache_source (the tasks root),
+    keyed by each file's path, mtime and size, so a repeat search reads one
+    cache file instead of every task-index.json.
+    """
+    use_cache = cache_enabled()
+    cached: dict = {}
+    if use_cache:
+        fingerprint = source_fingerprint(load_task_index)
+        cached = read_entry("task-index", cache_source, fingerprint) or {}
+    entries: dict[str, tuple[int, int, Optional[dict]]] = {}
+    changed = False
+    out: list[Optional[dict]] = []
+    for task_dir in task_dirs:
+        idx_path = os.path.join(task_dir, "task-index.json")
+        try:
+            st = os.stat(idx_path)
+        except OSError:
+            out.append(None)
+            continue
+        if not stat.S_ISREG(st.st_mode):
+            out.append(None)
+            continue
+        hit = cached.get(idx_path)
+        if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+            data = hit[2]
+        else:
+            data = _read_index_file(idx_path)
+            changed = True
+        entries[idx_path] = (st.st_mtime_ns, st.st_size, data)
+        out.append(data)
+    if use_cache and (changed or len(entries) != len(cached)):
+        write_entry("task-index", cache_source, fingerprint, entries)
+    return out
+
+
 def save_task_index(task_root: Path, data: dict) -> None:
     """Atomically save task-index.json."""
     idx_path = task_root / "task-index.json"
     tmp_path = idx_path.with_suffix(".partial")
-    with open(tmp_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    payload = dumps_indented_bytes(data)
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
     os.replace(tmp_path, idx_path)
 
 
 # ── Search ────────────────────────────────────────────────────────────────────
 
 
-def _score_task(data: dict, query_tokens: list[str]) -> float:
-    """Score a task against query tokens. Higher = better match."""
-    search_meta = data.get("search", {}) if isinstance(data.get("search"), dict) else {}
+def _search_meta(data: dict) -> dict:
+    """The index's "search" mapping, or {} when it is missing or malformed."""
+    search = data.get("search")
+    return search if isinstance(search, dict) else {}
+
+
+def _score_task(data: dict, query_tokens: list[str], query_text: str) -> float:
+    """Score a task against query tokens. Higher = better match.
+
+    query_text is " ".join(query_tokens), built once per search by the caller.
+    """
+    task_name = data.get("task_name", "")
+    name_text = task_name.lower() if task_name else ""
+    # Every token found in the name alone already scores 1.0.
+    if name_text and query_tokens and all(t in name_text for t in query_tokens):
+        return 1.0
+
+    search_meta = _search_meta(data)
 
     # Collect searchable text fields
     texts = []
-    task_name = data.get("task_name", "")
     if task_name:
         texts.append(task_name)
 
@@ -103,12 +170,12 @@ def _score_task(data: dict, query_tokens: list[str]) -> float:
     if not corpus or not query_tokens:
         return 0.0
 
-    # Simple token-overlap score
-    matched = sum(1 for t in query_tokens if t in corpus)
+    # Simple token-overlap score (substring match, so "perf" finds "performance")
+    matched = sum(map(corpus.__contains__, query_tokens))
     score = matched / len(query_tokens)
 
     # Boost for exact task-name match
-    if task_name.lower() in " ".join(query_tokens):
+    if name_text in query_text:
         score = min(1.0, score + 0.3)
 
     return score
@@ -131,52 +198,42 @@ def cmd_search(args: argparse.Namespace) -> int:
         return 1
 
     query_tokens = query.lower().split()
+    query_text = " ".join(query_tokens)
     threshold = float(args.threshold) if args.threshold else 0.3
     top_n = int(args.top) if args.top else 5
 
-    results = []
-    for task_dir in sorted(tasks_root.iterdir()):
-        if not task_dir.is_dir():
-            continue
-        data = load_task_index(task_dir)
+    task_dirs = _sorted_subdirs(tasks_root)
+    indexes = load_task_indexes(task_dirs, str(tasks_root.resolve()))
+
+    matches: list[tuple[float, Path, dict]] = []
+    for task_dir, data in zip(task_dirs, indexes):
         if data is None:
             # Check if directory looks like a task root (has plan/impl/review)
             if not (task_dir / "plan").is_dir() and not (task_dir / "state").is_dir():
                 continue
             data = {"task_name": task_dir.name}
 
-        score = _score_task(data, query_tokens)
+        score = _score_task(data, query_tokens, query_text)
         if score >= threshold:
-            results.append(
-                {
-                    "task_name": data.get("task_name", task_dir.name),
-                    "task_root": str(task_dir),
-                    "score": round(score, 3),
-                    "summary": (
-                        data.get("search", {}).get("summary", "")
-                        if isinstance(data.get("search"), dict)
-                        else ""
-                    ),
-                    "updated_at": data.get("updated_at", ""),
-                    "latest_run_id": data.get("latest_run_id", ""),
-                }
-            )
-
-    results.sort(key=lambda r: r["score"], reverse=True)
-    results = results[:top_n]
+            matches.append((round(score, 3), task_dir, data))
+
+    # nlargest keeps sorted()'s stable order for equal scores.
+    results = heapq.nlargest(top_n, matches, key=itemgetter(0))
 
     if not results:
         print(f"No tasks found matching: {query!r} (threshold={threshold})")
         return 0
 
     print(f"Found {len(results)} task(s) matching: {query!r}\n")
-    for r in results:
-        print(f"  score={r['score']:.3f}  name={r['task_name']}")
-        print(f"          root={r['task_root']}")
-        if r["summary"]:
-            print(f"          summary={r['summary'][:80]}")
-        if r["updated_at"]:
-            print(f"          updated={r['updated_at']}")
+    for score, task_dir, data in results:
+        summary = _search_meta(data).get("summary", "")
+        updated_at = data.get("updated_at", "")
+        print(f"  score={score:.3f}  name={data.get('task_name', task_dir.name)}")
+        print(f"          root={task_dir}")
+        if summary:
+            print(f"          summary={summary[:80]}")
+        if updated_at:
+            print(f"          updated={updated_at}")
         print()
 
     return 0
@@ -288,9 +345,7 @@ def cmd_migrate(args: argparse.Namespace) -> int:
     for legacy_root in legacy_roots:
         if not legacy_root.is_dir():
             continue
-        for d in sorted(legacy_root.iterdir()):
-            if not d.is_dir():
-                continue
+        for d in _sorted_subdirs(legacy_root):
             # Skip if it looks like a phase dir (plan/task/review), not a task container
             if d.name in {"plan", "task", "review", "state", "sessions"}:
                 continue
@@ -323,8 +378,26 @@ def _iso_now() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
+def _sorted_subdirs(root: Path) -> list[Path]:
+    """Subdirectories of root (symlinks followed), sorted by name.
+
+    DirEntry.is_dir() answers from the directory listing, so unlike
+    Path.iterdir() + is_dir() this does not stat every entry.
+    """
+    with os.scandir(root) as it:
+        names = sorted(entry.name for entry in it if entry.is_dir())
+    return [root / name for name in names]
+
+
 def _detect_repo_root() -> Path:
-    """Find repo root via git, falling back to cwd."""
+    """Find repo root from the nearest .git above cwd, else via git, else cwd."""
+    # The walk (a .git directory, or a file in worktrees and submodules) avoids
+    # forking git; GIT_DIR/GIT_WORK_TREE overrides are left to git itself.
+    if "GIT_DIR" not in os.environ and "GIT_WORK_TREE" not in os.environ:
+        cwd = Path.cwd()
+        for candidate in (cwd, *cwd.parents):
+            if os.path.exists(os.path.join(candidate, ".git")):
+                return candidate
     try:
         import subprocess
 